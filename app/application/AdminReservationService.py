@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.ReservationRepository import ReservationRepository
 from app.application.ReservationDto import (
     ReservationCreateDTO,
@@ -8,40 +9,38 @@ from app.application.ReservationDto import (
 )
 from app.application.ExamScheduleDto import ExamScheduleCreateDTO, ExamScheduleResponseDTO
 from app.domain.Reservation import Reservation, ReservationStatus
-from app.domain.Exception import ReservationException
+from app.domain.Exception import NotFoundException, CapacityExceededException, InvalidStateException, ValidationException
+
+# Archive 조회 한 페이지의 최대 건수
+MAX_ARCHIVE_PAGE_SIZE = 1000
 
 class AdminReservationService:
     def __init__(self, repository: ReservationRepository):
         self.repository = repository
 
-    # 전체 예약 조회 (관리자 전용)
-    async def get_all_reservations(self) -> List[dict]:
-        reservations = await self.repository.list_all()
-        results = []
-        for r in reservations:
-            exam_schedule = await self.repository.get_exam_schedule_by_id(r.exam_schedule_id)
+    # 전체 예약 스트리밍 조회 (관리자 전용, 대용량 목록 응답용)
+    # 시험 일정 시각은 JOIN 으로 함께 읽으므로 예약마다 일정을 다시 조회하지 않습니다.
+    async def stream_all_reservations(self, session: AsyncSession):
+        async for r, exam_start, exam_end in self.repository.stream_all_with_schedule(session):
             dto = ReservationResponseDTO.model_validate(r).model_dump()
-            if exam_schedule:
-                dto["exam_start"] = exam_schedule.exam_start
-                dto["exam_end"] = exam_schedule.exam_end
-            results.append(dto)
-        return results
+            dto["exam_start"] = exam_start
+            dto["exam_end"] = exam_end
+            yield dto
 
     # 예약 확정 (관리자 전용)
-    async def confirm_reservation(self, reservation_id: int) -> dict:
-        reservation = await self.repository.get_by_id(reservation_id)
+    async def confirm_reservation(self, session: AsyncSession, reservation_id: int) -> dict:
+        reservation = await self.repository.get_by_id(session, reservation_id)
         if not reservation:
-            raise ReservationException("Reservation not found")
+            raise NotFoundException("Reservation not found")
         if reservation.status == ReservationStatus.confirmed:
-            raise ReservationException("Reservation already confirmed")
+            raise InvalidStateException("Reservation already confirmed")
         
-        exam_schedule = await self.repository.get_exam_schedule_by_id(reservation.exam_schedule_id)
-        confirmed_sum = await self.repository.get_confirmed_sum(exam_schedule.id)
+        exam_schedule = await self.repository.get_exam_schedule_by_id(session, reservation.exam_schedule_id)
+        confirmed_sum = await self.repository.get_confirmed_sum(session, exam_schedule.id)
         if confirmed_sum + reservation.num_examinees > exam_schedule.capacity:
-            raise ReservationException("Confirming this reservation exceeds capacity for the exam schedule")
+            raise CapacityExceededException("Confirming this reservation exceeds capacity for the exam schedule")
         
-        reservation.status = ReservationStatus.confirmed
-        reservation = await self.repository.update(reservation)
+        reservation = await self.repository.update_status(session, reservation, ReservationStatus.confirmed)
         response = ReservationResponseDTO.model_validate(reservation).model_dump()
         if exam_schedule:
             response["exam_start"] = exam_schedule.exam_start
@@ -49,19 +48,18 @@ class AdminReservationService:
         return response
 
     # 예약 수정 (관리자는 예약 인원 변경 등 일부 수정 가능)
-    async def update_reservation(self, reservation_id: int, dto: ReservationUpdateDTO) -> dict:
-        reservation = await self.repository.get_by_id(reservation_id)
+    async def update_reservation(self, session: AsyncSession, reservation_id: int, dto: ReservationUpdateDTO) -> dict:
+        reservation = await self.repository.get_by_id(session, reservation_id)
         if not reservation:
-            raise ReservationException("Reservation not found")
+            raise NotFoundException("Reservation not found")
         
         new_num_examinees = dto.num_examinees if dto.num_examinees is not None else reservation.num_examinees
-        exam_schedule = await self.repository.get_exam_schedule_by_id(reservation.exam_schedule_id)
-        confirmed_sum = await self.repository.get_confirmed_sum(exam_schedule.id, exclude_id=reservation_id)
+        exam_schedule = await self.repository.get_exam_schedule_by_id(session, reservation.exam_schedule_id)
+        confirmed_sum = await self.repository.get_confirmed_sum(session, exam_schedule.id, exclude_id=reservation_id)
         if confirmed_sum + new_num_examinees > exam_schedule.capacity:
-            raise ReservationException("Exceeds available capacity for this exam schedule")
+            raise CapacityExceededException("Exceeds available capacity for this exam schedule")
         
-        reservation.num_examinees = new_num_examinees
-        reservation = await self.repository.update(reservation)
+        reservation = await self.repository.update_num_examinees(session, reservation, new_num_examinees)
         response = ReservationResponseDTO.model_validate(reservation).model_dump()
         if exam_schedule:
             response["exam_start"] = exam_schedule.exam_start
@@ -69,8 +67,32 @@ class AdminReservationService:
         return response
     
     # 예약 삭제 (관리자 전용)
-    async def delete_reservation(self, reservation_id: int):
-        reservation = await self.repository.get_by_id(reservation_id)
+    async def delete_reservation(self, session: AsyncSession, reservation_id: int):
+        reservation = await self.repository.get_by_id(session, reservation_id)
         if not reservation:
-            raise ReservationException("Reservation not found")
-        await self.repository.delete(reservation)
+            raise NotFoundException("Reservation not found")
+        await self.repository.delete(session, reservation)
+
+    # 종료된 시험 일정 Archive 처리 (관리자 전용, 주기적 배치 작업에서 호출)
+    async def archive_completed_schedules(self, session: AsyncSession, before: datetime = None, batch_size: int = 100) -> dict:
+        if batch_size <= 0:
+            raise ValidationException("Batch size must be greater than 0")
+        cutoff = before or datetime.now(timezone.utc)
+        archived = await self.repository.archive_completed_schedules(session, cutoff, batch_size=batch_size)
+        return {"archived_exam_schedules": archived}
+
+    # 과거(Archive) 예약 조회 (관리자 전용, 다음 페이지는 마지막 항목의 id 를 after_id 로 전달)
+    async def get_archived_reservations(self, session: AsyncSession, after_id: int = 0, limit: int = 100,
+                                        exam_schedule_id: int = None, user_id: str = None) -> List[dict]:
+        if not 0 < limit <= MAX_ARCHIVE_PAGE_SIZE:
+            raise ValidationException(f"Limit must be between 1 and {MAX_ARCHIVE_PAGE_SIZE}")
+        rows = await self.repository.list_archived(
+            session, after_id=after_id, limit=limit, exam_schedule_id=exam_schedule_id, user_id=user_id
+        )
+        results = []
+        for r, exam_start, exam_end in rows:
+            dto = ReservationResponseDTO.model_validate(r).model_dump()
+            dto["exam_start"] = exam_start
+            dto["exam_end"] = exam_end
+            results.append(dto)
+        return results
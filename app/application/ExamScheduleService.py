@@ -1,19 +1,21 @@
-from datetime import datetime, timezone
 from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.ReservationRepository import ReservationRepository
 from app.application.ExamScheduleDto import ExamScheduleCreateDTO, ExamScheduleResponseDTO
 from app.domain.ExamSchedule import ExamSchedule
+from app.domain.Exception import ValidationException
 
 class ExamScheduleService:
     def __init__(self, repository: ReservationRepository):
         self.repository = repository
 
     # 시험 일정 생성 (관리자 전용)
-    async def create_exam_schedule(self, dto: ExamScheduleCreateDTO) -> ExamScheduleResponseDTO:
+    async def create_exam_schedule(self, session: AsyncSession, dto: ExamScheduleCreateDTO) -> ExamScheduleResponseDTO:
         if dto.exam_start >= dto.exam_end:
-            raise Exception("Exam start must be before exam end")
+            raise ValidationException("Exam start must be before exam end")
 
         exam_schedule = await self.repository.create_exam_schedule(
+            session,
             exam_start=dto.exam_start,
             exam_end=dto.exam_end,
             capacity=dto.capacity
@@ -28,28 +30,22 @@ class ExamScheduleService:
         )
 
     # 시험 일정 조회 (모든 사용자에게 공개)
-    async def get_exam_schedules(self) -> List[dict]:
-        schedules = await self.repository.get_exam_schedules()
+    async def get_exam_schedules(self, session: AsyncSession) -> List[dict]:
+        schedules = await self.repository.get_exam_schedules(session)
+        return [_to_response(s) for s in schedules]
 
-        dto_list = [
-            ExamScheduleResponseDTO(
-                id=s["exam_schedule_id"],
-                exam_start=s["exam_start"],
-                exam_end=s["exam_end"],
-                capacity=s["capacity"],
-                confirmed_count=s["confirmed_count"],
-                available_capacity=s["available_capacity"]
-            ).model_dump()
-            for s in schedules
-        ]
+    # 시험 일정 스트리밍 조회 (대용량 목록 응답용)
+    async def stream_exam_schedules(self, session: AsyncSession):
+        async for s in self.repository.stream_exam_schedules(session):
+            yield _to_response(s)
 
-        # datetime을 ISO 형식으로 변환
-        for d in dto_list:
-            for key in ["exam_start", "exam_end"]:
-                if isinstance(d.get(key), datetime):
-                    dt = d[key]
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    d[key] = dt.isoformat()
-
-        return dto_list
+# exam_start/exam_end 는 UTCDateTime 컬럼에서 이미 UTC tzinfo가 붙은 값으로 조회되므로 별도 변환이 필요 없습니다.
+def _to_response(s: dict) -> dict:
+    return ExamScheduleResponseDTO(
+        id=s["exam_schedule_id"],
+        exam_start=s["exam_start"],
+        exam_end=s["exam_end"],
+        capacity=s["capacity"],
+        confirmed_count=s["confirmed_count"],
+        available_capacity=s["available_capacity"]
+    ).model_dump()
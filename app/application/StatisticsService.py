@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.StatisticsRepository import StatisticsRepository
+from app.domain.Exception import ValidationException
+
+class StatisticsService:
+    def __init__(self, repository: StatisticsRepository):
+        self.repository = repository
+
+    # 관리자 대시보드 통계 조회 (관리자 전용)
+    # 조회 전에 새로 쌓인 이벤트만 집계 테이블에 반영하므로 전체 예약 테이블을 읽지 않습니다.
+    async def get_statistics(self, session: AsyncSession, days: int = 30) -> dict:
+        if days <= 0:
+            raise ValidationException("Days must be greater than 0")
+        refreshed_events = await self.repository.refresh(session)
+
+        schedules = []
+        for row in await self.repository.list_exam_schedule_stats(session):
+            exam_schedule_id, exam_start, exam_end, capacity, pending_cnt, pending_num, confirmed_cnt, confirmed_num = row
+            schedules.append({
+                "exam_schedule_id": exam_schedule_id,
+                "exam_start": exam_start,
+                "exam_end": exam_end,
+                "capacity": capacity,
+                "pending_reservations": pending_cnt,
+                "pending_examinees": pending_num,
+                "confirmed_reservations": confirmed_cnt,
+                "confirmed_examinees": confirmed_num,
+                "fill_rate": round(confirmed_num / capacity, 4) if capacity else 0.0
+            })
+
+        since = (datetime.now(timezone.utc) - timedelta(days=days - 1)).date()
+        daily = [
+            {"day": day, "event_type": event_type, "reservations": reservations, "examinees": examinees}
+            for day, event_type, reservations, examinees in await self.repository.list_daily_stats(session, since)
+        ]
+        return {"refreshed_events": refreshed_events, "exam_schedules": schedules, "daily": daily}
+
+    # 집계 테이블 전체 재계산 (관리자 전용, 수동 복구용)
+    async def rebuild_statistics(self, session: AsyncSession) -> dict:
+        last_event_id = await self.repository.rebuild(session)
+        return {"last_event_id": last_event_id}
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 class ExamSchedule(BaseModel):
@@ -6,8 +6,8 @@ class ExamSchedule(BaseModel):
     exam_start: datetime
     exam_end: datetime
     capacity: int = Field(..., ge=0)  # 0 이상의 값만 허용
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     def is_valid(self) -> bool:
         # 시험 시작일이 시험 종료일보다 이전인지 확인
@@ -15,4 +15,4 @@ class ExamSchedule(BaseModel):
 
     def update_timestamp(self):
         # 업데이트 시각 갱신
-        self.updated_at = datetime.now()
+        self.updated_at = datetime.now(timezone.utc)
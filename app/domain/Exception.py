@@ -1,5 +1,26 @@
 class DomainException(Exception):
-    pass
+    # 클라이언트가 오류 종류를 구분할 수 있도록 내려주는 기계 판독용 코드
+    code = "domain_error"
 
 class ReservationException(DomainException):
-    pass
+    code = "reservation_error"
+
+# 대상(예약, 시험 일정)을 찾을 수 없음
+class NotFoundException(DomainException):
+    code = "not_found"
+
+# 시험 일정 정원 초과
+class CapacityExceededException(DomainException):
+    code = "capacity_exceeded"
+
+# 권한 없음 (다른 사용자의 예약, 관리자 전용 기능)
+class PermissionDeniedException(DomainException):
+    code = "permission_denied"
+
+# 현재 상태에서 허용되지 않는 변경 (이미 확정된 예약 등)
+class InvalidStateException(DomainException):
+    code = "invalid_state"
+
+# 입력 값 또는 비즈니스 규칙 위반
+class ValidationException(DomainException):
+    code = "validation_error"
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 import enum
 
@@ -6,6 +6,13 @@ class ReservationStatus(str, enum.Enum):
     pending = "pending"
     confirmed = "confirmed"
 
+# 예약 상태 변경 이벤트 종류 (Audit Event Log)
+class ReservationEventType(str, enum.Enum):
+    created = "created"
+    confirmed = "confirmed"
+    updated = "updated"
+    deleted = "deleted"
+
 class Reservation(BaseModel):
     id: int | None = None
     user_id: str | None = None
@@ -14,8 +21,8 @@ class Reservation(BaseModel):
     exam_end: datetime | None = None
     num_examinees: int = Field(0, ge=0)
     status: ReservationStatus = ReservationStatus.pending
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     def is_pending(self) -> bool:
         return self.status == ReservationStatus.pending
@@ -24,4 +31,4 @@ class Reservation(BaseModel):
         if self.status == ReservationStatus.confirmed:
             raise ValueError("Reservation already confirmed")
         self.status = ReservationStatus.confirmed
-        self.updated_at = datetime.now()
+        self.updated_at = datetime.now(timezone.utc)
@@ -0,0 +1,62 @@
+# EventReplay.py
+# Audit Event Log(reservation_events)를 처음부터 재생하여 시험 일정별 확정 인원을 다시 계산합니다.
+# 장애 이후 reservations 테이블과 비교하여 정원 정보를 복구/검증할 때 사용합니다.
+#
+# 실행: python -m app.infrastructure.EventReplay
+import asyncio
+from collections import defaultdict
+from typing import Dict, Iterable
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.Reservation import ReservationStatus, ReservationEventType
+from app.infrastructure.ReservationRepository import ReservationRepository
+
+class ConfirmedCountReplayer:
+    def __init__(self):
+        # reservation_id -> (exam_schedule_id, status, num_examinees)
+        self._reservations = {}
+
+    def apply(self, reservation_id: int, exam_schedule_id: int, event_type: str, status: str, num_examinees: int):
+        if event_type == ReservationEventType.deleted.value:
+            self._reservations.pop(reservation_id, None)
+        else:
+            self._reservations[reservation_id] = (exam_schedule_id, status, num_examinees)
+
+    def confirmed_counts(self) -> Dict[int, int]:
+        counts = defaultdict(int)
+        for exam_schedule_id, status, num_examinees in self._reservations.values():
+            if status == ReservationStatus.confirmed.value:
+                counts[exam_schedule_id] += num_examinees
+        return dict(counts)
+
+def replay_confirmed_counts(events: Iterable) -> Dict[int, int]:
+    replayer = ConfirmedCountReplayer()
+    for reservation_id, exam_schedule_id, event_type, status, num_examinees in events:
+        replayer.apply(reservation_id, exam_schedule_id, event_type, status, num_examinees)
+    return replayer.confirmed_counts()
+
+async def rebuild_confirmed_counts(session: AsyncSession, repository: ReservationRepository = None) -> Dict[int, int]:
+    repository = repository or ReservationRepository()
+    replayer = ConfirmedCountReplayer()
+    async for reservation_id, exam_schedule_id, event_type, status, num_examinees in repository.stream_events(session):
+        replayer.apply(reservation_id, exam_schedule_id, event_type, status, num_examinees)
+    return replayer.confirmed_counts()
+
+async def main():
+    from app.infrastructure.Database import async_session, engine
+
+    repository = ReservationRepository()
+    async with async_session() as session:
+        replayed = await rebuild_confirmed_counts(session, repository)
+        schedules = await repository.get_exam_schedules(session)
+
+    mismatches = 0
+    for s in schedules:
+        expected = replayed.get(s["exam_schedule_id"], 0)
+        mark = "OK" if expected == s["confirmed_count"] else "MISMATCH"
+        mismatches += mark != "OK"
+        print(f"exam_schedule {s['exam_schedule_id']}: replayed={expected} current={s['confirmed_count']} {mark}")
+    print(f"{len(schedules)} schedules checked, {mismatches} mismatches")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
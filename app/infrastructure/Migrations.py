@@ -0,0 +1,114 @@
+# Migrations.py
+# create_all 은 이미 존재하는 테이블의 컬럼 타입/인덱스를 바꾸지 않으므로, 기존 DB는 이 스크립트로 갱신합니다.
+# - 기존 PostgreSQL DB의 timezone 없는 timestamp 컬럼(UTC 기준 naive 값)을 TIMESTAMP WITH TIME ZONE 으로 변환합니다.
+# - Hot 쿼리가 사용하는 인덱스를 만들고, 대체된 인덱스를 삭제합니다.
+# 이미 적용된 항목은 건너뛰므로 여러 번 실행해도 안전합니다.
+# 애플리케이션 시작(worker 마다 실행) 시가 아니라 배포 시 한 번만 실행합니다.
+#
+# 실행: python -m app.infrastructure.Migrations
+import asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 변환 대상 컬럼 (기존 값은 datetime.utcnow 로 저장된 UTC 기준 값)
+UTC_DATETIME_COLUMNS = {
+    "reservations": ["created_at", "updated_at"],
+    "exam_schedules": ["created_at"],
+    "reservations_archive": ["created_at", "updated_at", "archived_at"],
+    "exam_schedules_archive": ["created_at", "archived_at"],
+    "reservation_events": ["created_at"],
+}
+
+# 동시에 실행된 마이그레이션을 직렬화하는 advisory lock 키
+MIGRATION_LOCK_KEY = 7_240_331
+
+# 트랜잭션 종료 시 해제되는 잠금 (같은 세션에서 다시 잡아도 대기하지 않음, SQLite는 DB 단위 잠금으로 대체)
+async def _acquire_migration_lock(conn: AsyncConnection):
+    if conn.dialect.name == "postgresql":
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+async def migrate_datetimes_to_utc(conn: AsyncConnection) -> list:
+    # SQLite는 timezone 타입이 없고 UTCDateTime 타입이 UTC로 저장/조회하므로 변환할 것이 없습니다.
+    if conn.dialect.name != "postgresql":
+        return []
+
+    # 이미 timestamptz 인 컬럼에 ALTER ... AT TIME ZONE 'UTC' 를 다시 실행하면 세션 TimeZone 만큼 값이 밀리므로,
+    # 잠금을 먼저 잡고 (다른 실행이 커밋한 뒤의) 컬럼 타입을 읽습니다.
+    await _acquire_migration_lock(conn)
+    result = await conn.execute(text(
+        "SELECT table_name, column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND data_type = 'timestamp without time zone'"
+    ))
+    naive_columns = {(row.table_name, row.column_name) for row in result}
+
+    migrated = []
+    for table, columns in UTC_DATETIME_COLUMNS.items():
+        for column in columns:
+            if (table, column) not in naive_columns:
+                continue
+            await conn.execute(text(
+                f'ALTER TABLE "{table}" ALTER COLUMN "{column}" '
+                f'TYPE TIMESTAMP WITH TIME ZONE USING "{column}" AT TIME ZONE \'UTC\''
+            ))
+            migrated.append(f"{table}.{column}")
+    return migrated
+
+# Hot 쿼리 인덱스 (이름 → (테이블, 컬럼 목록)), ORM 의 __table_args__ 와 같은 정의
+INDEXES = {
+    "ix_reservations_schedule_status_examinees": ("reservations", ["exam_schedule_id", "status", "num_examinees"]),
+}
+
+# Covering Index 로 대체되어 더 이상 사용하지 않는 인덱스
+DROPPED_INDEXES = ["ix_reservations_exam_schedule_id"]
+
+# PostgreSQL 은 CONCURRENTLY 로 인덱스를 만들고 삭제하여 운영 중인 reservations 테이블의 쓰기를 막지 않습니다.
+# CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없으므로 conn 은 AUTOCOMMIT 연결이어야 하며,
+# 동시 실행은 트랜잭션 잠금 대신 세션 단위 advisory lock 으로 직렬화합니다.
+# SQLite 는 기존처럼 현재 트랜잭션 안에서 CREATE/DROP INDEX IF [NOT] EXISTS 를 실행합니다.
+async def migrate_indexes(conn: AsyncConnection) -> list:
+    if conn.dialect.name != "postgresql":
+        await _acquire_migration_lock(conn)
+        await _create_and_drop_indexes(conn, "")
+        return list(INDEXES)
+
+    await conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    try:
+        # 이전 CONCURRENTLY 실행이 중간에 실패하면 INVALID 인덱스가 남고 IF NOT EXISTS 가 이를 건너뛰므로 먼저 삭제합니다.
+        result = await conn.execute(text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ), {"names": list(INDEXES)})
+        for name in result.scalars().all():
+            await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+        await _create_and_drop_indexes(conn, "CONCURRENTLY ")
+    finally:
+        await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    return list(INDEXES)
+
+async def _create_and_drop_indexes(conn: AsyncConnection, concurrently: str):
+    # CREATE/DROP INDEX IF [NOT] EXISTS 는 PostgreSQL 과 SQLite 모두 지원합니다.
+    for name, (table, columns) in INDEXES.items():
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        await conn.execute(text(f'CREATE INDEX {concurrently}IF NOT EXISTS "{name}" ON "{table}" ({column_list})'))
+    for name in DROPPED_INDEXES:
+        await conn.execute(text(f'DROP INDEX {concurrently}IF EXISTS "{name}"'))
+
+async def main():
+    from app.infrastructure.Database import engine
+
+    async with engine.begin() as conn:
+        migrated = await migrate_datetimes_to_utc(conn)
+    # 인덱스는 컬럼 변환 트랜잭션이 끝난 뒤 AUTOCOMMIT 연결에서 만듭니다. (PostgreSQL CONCURRENTLY)
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            indexes = await migrate_indexes(conn)
+        else:
+            async with conn.begin():
+                indexes = await migrate_indexes(conn)
+    print(f"Migrated {len(migrated)} columns: {', '.join(migrated) or '-'}")
+    print(f"Ensured {len(indexes)} indexes: {', '.join(indexes)}")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
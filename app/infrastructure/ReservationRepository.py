@@ -1,71 +1,190 @@
-from sqlalchemy import func, select, case
+from sqlalchemy import func, select, case, insert, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.infrastructure.Database import Base
-from app.domain.Reservation import Reservation, ReservationStatus
-from sqlalchemy import Column, Integer, String, DateTime
+from app.domain.Reservation import Reservation, ReservationStatus, ReservationEventType
+from sqlalchemy import Column, Integer, String, Index
+from app.infrastructure.UTCDateTime import UTCDateTime, utcnow
 
 # ORM 모델 정의 (Domain 객체와 분리하여 Persistence Model로 사용)
 class ReservationORM(Base):
     __tablename__ = "reservations"
+    # 정원 집계(get_confirmed_sum, get_exam_schedules)가 테이블을 읽지 않고 인덱스만으로 처리되도록 하는 Covering Index
+    __table_args__ = (
+        Index("ix_reservations_schedule_status_examinees", "exam_schedule_id", "status", "num_examinees"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String, index=True)
     exam_schedule_id = Column(Integer, nullable=False)
     num_examinees = Column(Integer, nullable=False)
     status = Column(String, nullable=False, default=ReservationStatus.pending.value)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(UTCDateTime, default=utcnow)
+    updated_at = Column(UTCDateTime, default=utcnow, onupdate=utcnow)
 
 class ExamScheduleORM(Base):
     __tablename__ = "exam_schedules"
     id = Column(Integer, primary_key=True, index=True)
-    exam_start = Column(DateTime(timezone=True), nullable=False)
-    exam_end = Column(DateTime(timezone=True), nullable=False)
+    exam_start = Column(UTCDateTime, nullable=False)
+    exam_end = Column(UTCDateTime, nullable=False)
     capacity = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(UTCDateTime, default=utcnow)
+
+# 종료된 시험 일정과 그 예약을 보관하는 Cold Archive 테이블
+# (Hot 테이블에는 현재/미래 일정만 남겨 집계 쿼리 비용을 줄입니다)
+class ReservationArchiveORM(Base):
+    __tablename__ = "reservations_archive"
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String, index=True)
+    exam_schedule_id = Column(Integer, nullable=False, index=True)
+    num_examinees = Column(Integer, nullable=False)
+    status = Column(String, nullable=False)
+    created_at = Column(UTCDateTime)
+    updated_at = Column(UTCDateTime)
+    archived_at = Column(UTCDateTime, default=utcnow)
+
+class ExamScheduleArchiveORM(Base):
+    __tablename__ = "exam_schedules_archive"
+    id = Column(Integer, primary_key=True)
+    exam_start = Column(UTCDateTime, nullable=False)
+    exam_end = Column(UTCDateTime, nullable=False)
+    capacity = Column(Integer, nullable=False)
+    created_at = Column(UTCDateTime)
+    archived_at = Column(UTCDateTime, default=utcnow)
+
+# 예약 상태 변경 이력 (Append-only Audit Event Log)
+# 예약 변경과 같은 트랜잭션에서 기록되며, 삭제된 예약의 이력도 남도록 FK를 두지 않습니다.
+class ReservationEventORM(Base):
+    __tablename__ = "reservation_events"
+    id = Column(Integer, primary_key=True)
+    reservation_id = Column(Integer, nullable=False, index=True)
+    exam_schedule_id = Column(Integer, nullable=False, index=True)
+    event_type = Column(String, nullable=False)
+    status = Column(String, nullable=False)
+    num_examinees = Column(Integer, nullable=False)
+    prev_status = Column(String)
+    prev_num_examinees = Column(Integer)
+    created_at = Column(UTCDateTime, default=utcnow)
+
+def _exam_schedule_summary(row) -> dict:
+    exam_schedule_id, exam_start, exam_end, capacity, confirmed_count = row
+    return {
+        "exam_schedule_id": exam_schedule_id,
+        "exam_start": exam_start,
+        "exam_end": exam_end,
+        "capacity": capacity,
+        "confirmed_count": confirmed_count,
+        "available_capacity": max(capacity - confirmed_count, 0)
+    }
+
+def _status_value(status) -> str:
+    return status.value if isinstance(status, ReservationStatus) else status
 
 # Reservation Repository 구현
+# 상태를 갖지 않는 객체로, 애플리케이션 전체에서 하나의 인스턴스를 공유하고 세션은 호출마다 전달받습니다.
 class ReservationRepository:
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
-    async def create(self, reservation: Reservation) -> ReservationORM:
+    async def create(self, session: AsyncSession, reservation: Reservation) -> ReservationORM:
         orm_obj = ReservationORM(
             user_id=reservation.user_id,
             exam_schedule_id=reservation.exam_schedule_id,
             num_examinees=reservation.num_examinees,
             status=reservation.status.value if isinstance(reservation.status, ReservationStatus) else reservation.status
         )
-        self.session.add(orm_obj)
-        await self.session.commit()
-        await self.session.refresh(orm_obj)
+        session.add(orm_obj)
+        # 이벤트에 예약 id가 필요하므로 먼저 flush 후 같은 트랜잭션에서 이벤트를 기록합니다.
+        await session.flush()
+        self._append_event(session, orm_obj, ReservationEventType.created)
+        await session.commit()
+        await session.refresh(orm_obj)
         return orm_obj
 
-    async def get_by_id(self, reservation_id: int) -> ReservationORM:
-        stmt = select(ReservationORM).where(ReservationORM.id == reservation_id)
-        result = await self.session.execute(stmt)
+    # Hot 쿼리는 SELECT 문을 별도 메서드로 만들어 실행 계획 회귀 테스트(tests/QueryPlanTest.py)에서도 그대로 사용합니다.
+    def get_by_id_query(self, reservation_id: int):
+        return select(ReservationORM).where(ReservationORM.id == reservation_id)
+
+    async def get_by_id(self, session: AsyncSession, reservation_id: int) -> ReservationORM:
+        stmt = self.get_by_id_query(reservation_id)
+        result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_all(self):
-        stmt = select(ReservationORM)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+    def list_by_user_query(self, user_id: str):
+        return select(ReservationORM).where(ReservationORM.user_id == user_id)
+
+    # 관리자 전체 예약 목록을 시험 일정 시각과 함께 스트리밍 조회 (응답을 한 번에 메모리에 올리지 않음)
+    async def stream_all_with_schedule(self, session: AsyncSession, batch_size: int = 1000):
+        stmt = select(
+            ReservationORM,
+            ExamScheduleORM.exam_start,
+            ExamScheduleORM.exam_end
+        ).outerjoin(
+            ExamScheduleORM, ExamScheduleORM.id == ReservationORM.exam_schedule_id
+        ).order_by(ReservationORM.id).execution_options(yield_per=batch_size)
+        result = await session.stream(stmt)
+        async for row in result:
+            yield row
 
-    async def list_by_user(self, user_id: str):
-        stmt = select(ReservationORM).where(ReservationORM.user_id == user_id)
-        result = await self.session.execute(stmt)
+    async def list_by_user(self, session: AsyncSession, user_id: str):
+        stmt = self.list_by_user_query(user_id)
+        result = await session.execute(stmt)
         return result.scalars().all()
 
-    async def update(self, reservation: ReservationORM) -> ReservationORM:
-        await self.session.commit()
-        await self.session.refresh(reservation)
+    # 예약 상태 변경 (확정 등)
+    # 이벤트의 이전 값은 ORM 변경 이력(history)이 아니라 변경 직전 값을 직접 읽어 기록합니다.
+    # (변경 이후 다른 쿼리에서 autoflush 가 일어나면 history 가 비워져 이벤트가 누락될 수 있습니다)
+    async def update_status(self, session: AsyncSession, reservation: ReservationORM, status: ReservationStatus) -> ReservationORM:
+        prev_status, prev_num_examinees = reservation.status, reservation.num_examinees
+        reservation.status = status
+        if _status_value(prev_status) != _status_value(status):
+            event_type = ReservationEventType.confirmed if _status_value(status) == ReservationStatus.confirmed.value \
+                else ReservationEventType.updated
+            self._append_event(session, reservation, event_type, prev_status, prev_num_examinees)
+        return await self._commit(session, reservation)
+
+    # 예약 인원 변경
+    async def update_num_examinees(self, session: AsyncSession, reservation: ReservationORM, num_examinees: int) -> ReservationORM:
+        prev_status, prev_num_examinees = reservation.status, reservation.num_examinees
+        reservation.num_examinees = num_examinees
+        if prev_num_examinees != num_examinees:
+            self._append_event(session, reservation, ReservationEventType.updated, prev_status, prev_num_examinees)
+        return await self._commit(session, reservation)
+
+    async def _commit(self, session: AsyncSession, reservation: ReservationORM) -> ReservationORM:
+        await session.commit()
+        await session.refresh(reservation)
         return reservation
 
-    async def delete(self, reservation: ReservationORM):
-        await self.session.delete(reservation)
-        await self.session.commit()
+    async def delete(self, session: AsyncSession, reservation: ReservationORM):
+        self._append_event(session, reservation, ReservationEventType.deleted, reservation.status, reservation.num_examinees)
+        await session.delete(reservation)
+        await session.commit()
+
+    # 이벤트는 세션에만 추가하고 commit 시점에 한 번에 INSERT 됩니다.
+    # (같은 트랜잭션의 여러 이벤트는 SQLAlchemy가 하나의 batch INSERT로 묶습니다)
+    def _append_event(self, session: AsyncSession, reservation: ReservationORM, event_type: ReservationEventType,
+                      prev_status=None, prev_num_examinees: int = None):
+        session.add(ReservationEventORM(
+            reservation_id=reservation.id,
+            exam_schedule_id=reservation.exam_schedule_id,
+            event_type=event_type.value,
+            status=_status_value(reservation.status),
+            num_examinees=reservation.num_examinees,
+            prev_status=_status_value(prev_status) if prev_status is not None else None,
+            prev_num_examinees=prev_num_examinees
+        ))
+
+    # 기록 순서(id)대로 이벤트를 스트리밍 조회 (Replay 용)
+    async def stream_events(self, session: AsyncSession, batch_size: int = 1000):
+        stmt = select(
+            ReservationEventORM.reservation_id,
+            ReservationEventORM.exam_schedule_id,
+            ReservationEventORM.event_type,
+            ReservationEventORM.status,
+            ReservationEventORM.num_examinees
+        ).order_by(ReservationEventORM.id).execution_options(yield_per=batch_size)
+        result = await session.stream(stmt)
+        async for row in result:
+            yield row
 
-    async def get_confirmed_sum(self, exam_schedule_id: int, exclude_id: int = None) -> int:
+    def get_confirmed_sum_query(self, exam_schedule_id: int, exclude_id: int = None):
         stmt = select(func.coalesce(func.sum(
             case(
                 (ReservationORM.status == ReservationStatus.confirmed.value, ReservationORM.num_examinees),
@@ -75,11 +194,14 @@ class ReservationRepository:
         
         if exclude_id:
             stmt = stmt.where(ReservationORM.id != exclude_id)
-        
-        result = await self.session.execute(stmt)
+        return stmt
+
+    async def get_confirmed_sum(self, session: AsyncSession, exam_schedule_id: int, exclude_id: int = None) -> int:
+        stmt = self.get_confirmed_sum_query(exam_schedule_id, exclude_id=exclude_id)
+        result = await session.execute(stmt)
         return result.scalar() or 0
 
-    async def get_exam_schedules(self):
+    def get_exam_schedules_query(self):
         stmt = select(
             ExamScheduleORM.id,
             ExamScheduleORM.exam_start,
@@ -92,36 +214,90 @@ class ReservationRepository:
                 )
             ), 0).label("confirmed_count")
         ).outerjoin(ReservationORM, ExamScheduleORM.id == ReservationORM.exam_schedule_id)
-        stmt = stmt.group_by(ExamScheduleORM.id)
-        
-        result = await self.session.execute(stmt)
-        schedules = []
-        for row in result.all():
-            exam_schedule_id, exam_start, exam_end, capacity, confirmed_count = row
-            available_capacity = max(capacity - confirmed_count, 0)
-            schedules.append({
-                "exam_schedule_id": exam_schedule_id,
-                "exam_start": exam_start,
-                "exam_end": exam_end,
-                "capacity": capacity,
-                "confirmed_count": confirmed_count,
-                "available_capacity": available_capacity
-            })
-        return schedules
-
-    async def create_exam_schedule(self, exam_start: datetime, exam_end: datetime, capacity: int) -> ExamScheduleORM:
+        return stmt.group_by(ExamScheduleORM.id)
+
+    async def get_exam_schedules(self, session: AsyncSession):
+        stmt = self.get_exam_schedules_query()
+        result = await session.execute(stmt)
+        return [_exam_schedule_summary(row) for row in result.all()]
+
+    # 시험 일정 목록 스트리밍 조회 (get_exam_schedules 와 같은 결과를 batch 단위로 읽음)
+    async def stream_exam_schedules(self, session: AsyncSession, batch_size: int = 1000):
+        stmt = self.get_exam_schedules_query().order_by(ExamScheduleORM.id).execution_options(yield_per=batch_size)
+        result = await session.stream(stmt)
+        async for row in result:
+            yield _exam_schedule_summary(row)
+
+    async def create_exam_schedule(self, session: AsyncSession, exam_start: datetime, exam_end: datetime, capacity: int) -> ExamScheduleORM:
         exam_schedule = ExamScheduleORM(
             exam_start=exam_start,
             exam_end=exam_end,
             capacity=capacity
         )
-        self.session.add(exam_schedule)
-        await self.session.commit()
-        await self.session.refresh(exam_schedule)
+        session.add(exam_schedule)
+        await session.commit()
+        await session.refresh(exam_schedule)
         return exam_schedule
 
     # 추가: exam_schedule_id로 ExamSchedule 조회하는 메서드
-    async def get_exam_schedule_by_id(self, exam_schedule_id: int):
+    async def get_exam_schedule_by_id(self, session: AsyncSession, exam_schedule_id: int):
         stmt = select(ExamScheduleORM).where(ExamScheduleORM.id == exam_schedule_id)
-        result = await self.session.execute(stmt)
+        result = await session.execute(stmt)
         return result.scalar_one_or_none()
+
+    # 종료된 시험 일정과 예약을 배치 단위로 Archive 테이블로 이동
+    async def archive_completed_schedules(self, session: AsyncSession, before: datetime, batch_size: int = 100) -> int:
+        reservation_columns = ["id", "user_id", "exam_schedule_id", "num_examinees", "status", "created_at", "updated_at"]
+        schedule_columns = ["id", "exam_start", "exam_end", "capacity", "created_at"]
+        archived = 0
+        while True:
+            stmt = select(ExamScheduleORM.id).where(
+                ExamScheduleORM.exam_end < before
+            ).order_by(ExamScheduleORM.id).limit(batch_size)
+            result = await session.execute(stmt)
+            schedule_ids = result.scalars().all()
+            if not schedule_ids:
+                break
+
+            await session.execute(
+                insert(ExamScheduleArchiveORM).from_select(
+                    schedule_columns,
+                    select(*[getattr(ExamScheduleORM, c) for c in schedule_columns])
+                    .where(ExamScheduleORM.id.in_(schedule_ids))
+                )
+            )
+            await session.execute(
+                insert(ReservationArchiveORM).from_select(
+                    reservation_columns,
+                    select(*[getattr(ReservationORM, c) for c in reservation_columns])
+                    .where(ReservationORM.exam_schedule_id.in_(schedule_ids))
+                )
+            )
+            await session.execute(
+                delete(ReservationORM).where(ReservationORM.exam_schedule_id.in_(schedule_ids))
+            )
+            await session.execute(
+                delete(ExamScheduleORM).where(ExamScheduleORM.id.in_(schedule_ids))
+            )
+            # 배치마다 커밋하여 트랜잭션과 잠금 범위를 작게 유지합니다.
+            await session.commit()
+            archived += len(schedule_ids)
+        return archived
+
+    # 관리자용 과거 예약 조회 (Archive 테이블 전용 Read Path)
+    # Archive 는 계속 커지는 테이블이므로 id 기준 Keyset Pagination(after_id 이후 limit 건)으로만 조회합니다.
+    async def list_archived(self, session: AsyncSession, after_id: int = 0, limit: int = 100,
+                            exam_schedule_id: int = None, user_id: str = None):
+        stmt = select(
+            ReservationArchiveORM,
+            ExamScheduleArchiveORM.exam_start,
+            ExamScheduleArchiveORM.exam_end
+        ).outerjoin(
+            ExamScheduleArchiveORM, ExamScheduleArchiveORM.id == ReservationArchiveORM.exam_schedule_id
+        ).where(ReservationArchiveORM.id > after_id)
+        if exam_schedule_id is not None:
+            stmt = stmt.where(ReservationArchiveORM.exam_schedule_id == exam_schedule_id)
+        if user_id is not None:
+            stmt = stmt.where(ReservationArchiveORM.user_id == user_id)
+        result = await session.execute(stmt.order_by(ReservationArchiveORM.id).limit(limit))
+        return result.all()
@@ -0,0 +1,294 @@
+import os
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+from sqlalchemy import Column, Integer, String, Date, select, delete, func, case, literal, union_all
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.Database import Base
+from app.infrastructure.UTCDateTime import UTCDateTime, utcnow
+from app.infrastructure.ReservationRepository import ReservationORM, ExamScheduleORM, ReservationEventORM
+from app.domain.Reservation import ReservationStatus, ReservationEventType
+
+# 관리자 대시보드용 Materialized 집계 테이블
+# reservation_events 를 마지막으로 반영한 위치(watermark) 이후의 이벤트만 읽어 증분 갱신합니다.
+#
+# 이벤트 id 는 INSERT 시점에 발급되지만 커밋 순서는 id 순서와 다를 수 있습니다.
+# (예: 101번이 먼저 커밋되고 100번이 나중에 커밋되면, 101까지 반영한 뒤 100번은 영영 반영되지 않습니다)
+# 그래서 생성 후 REFRESH_LAG_SECONDS 가 지난 이벤트만, id 순서대로 아직 이른 이벤트를 만나기 전까지만 반영합니다.
+# 예약 변경 트랜잭션은 이 시간 안에 끝난다고 가정하므로, 서버 간 시계 오차를 포함해 충분히 크게 둡니다.
+REFRESH_LAG_SECONDS = float(os.getenv("STATS_REFRESH_LAG_SECONDS", "30"))
+
+# 시험 일정별 상태(pending/confirmed) 집계
+class ExamScheduleStatsORM(Base):
+    __tablename__ = "exam_schedule_stats"
+    exam_schedule_id = Column(Integer, primary_key=True)
+    pending_reservations = Column(Integer, nullable=False, default=0)
+    pending_examinees = Column(Integer, nullable=False, default=0)
+    confirmed_reservations = Column(Integer, nullable=False, default=0)
+    confirmed_examinees = Column(Integer, nullable=False, default=0)
+    updated_at = Column(UTCDateTime, default=utcnow, onupdate=utcnow)
+
+# 일자(UTC)별 이벤트 종류(created/confirmed/updated/deleted) 집계 (예약 속도 확인용)
+class ReservationDailyStatsORM(Base):
+    __tablename__ = "reservation_daily_stats"
+    day = Column(Date, primary_key=True)
+    event_type = Column(String, primary_key=True)
+    reservations = Column(Integer, nullable=False, default=0)
+    examinees = Column(Integer, nullable=False, default=0)
+
+# 집계에 반영된 마지막 이벤트 id
+class StatsWatermarkORM(Base):
+    __tablename__ = "stats_watermarks"
+    name = Column(String, primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+
+WATERMARK_NAME = "reservation_stats"
+
+_STATUS_COLUMNS = {
+    ReservationStatus.pending.value: ("pending_reservations", "pending_examinees"),
+    ReservationStatus.confirmed.value: ("confirmed_reservations", "confirmed_examinees"),
+}
+
+def _add_state(deltas: dict, status: str, num_examinees: int, sign: int):
+    columns = _STATUS_COLUMNS.get(status)
+    if columns is None:
+        return
+    count_column, examinees_column = columns
+    deltas[count_column] += sign
+    deltas[examinees_column] += sign * num_examinees
+
+# 이벤트 하나를 시험 일정별/일자별 증감량으로 변환
+def apply_event(schedule_deltas: dict, daily_deltas: dict, event):
+    deltas = schedule_deltas[event.exam_schedule_id]
+    if event.prev_status is not None:
+        _add_state(deltas, event.prev_status, event.prev_num_examinees, -1)
+    if event.event_type != ReservationEventType.deleted.value:
+        _add_state(deltas, event.status, event.num_examinees, 1)
+
+    daily = daily_deltas[(event.created_at.date(), event.event_type)]
+    daily["reservations"] += 1
+    daily["examinees"] += event.num_examinees
+
+# 상태를 갖지 않는 Repository (세션은 호출마다 전달)
+class StatisticsRepository:
+    def __init__(self, refresh_lag: Optional[timedelta] = None, clock: Callable[[], datetime] = utcnow):
+        self.refresh_lag = refresh_lag if refresh_lag is not None else timedelta(seconds=REFRESH_LAG_SECONDS)
+        self.clock = clock
+
+    async def refresh(self, session: AsyncSession, batch_size: int = 5000) -> int:
+        cutoff = self.clock() - self.refresh_lag
+        applied = 0
+        while True:
+            # commit 시 잠금이 풀리므로 batch 마다 watermark 를 다시 잠그고 읽습니다.
+            watermark = await self._get_watermark(session)
+            if watermark is None:
+                # 처음 조회가 동시에 들어와도 watermark 행을 만든 요청 하나만 전체 재계산합니다.
+                if await self._seed_watermark(session):
+                    await self.rebuild(session)
+                    return applied
+                continue
+
+            stmt = select(
+                ReservationEventORM.id,
+                ReservationEventORM.exam_schedule_id,
+                ReservationEventORM.event_type,
+                ReservationEventORM.status,
+                ReservationEventORM.num_examinees,
+                ReservationEventORM.prev_status,
+                ReservationEventORM.prev_num_examinees,
+                ReservationEventORM.created_at
+            ).where(
+                ReservationEventORM.id > watermark.last_event_id
+            )
+            # 아직 이른 이벤트부터는 그 앞의 id 가 커밋되지 않았을 수 있으므로 다음 조회로 미룹니다.
+            unsettled_id = await self._first_unsettled_event_id(session, watermark.last_event_id, cutoff)
+            if unsettled_id is not None:
+                stmt = stmt.where(ReservationEventORM.id < unsettled_id)
+            events = (await session.execute(stmt.order_by(ReservationEventORM.id).limit(batch_size))).all()
+            if not events:
+                # 이번 트랜잭션에서 잡은 watermark 잠금을 해제합니다.
+                await session.commit()
+                break
+
+            schedule_deltas = defaultdict(lambda: defaultdict(int))
+            daily_deltas = defaultdict(lambda: defaultdict(int))
+            for event in events:
+                apply_event(schedule_deltas, daily_deltas, event)
+            await self._apply_schedule_deltas(session, schedule_deltas)
+            await self._apply_daily_deltas(session, daily_deltas)
+
+            # 집계 반영과 watermark 이동을 같은 트랜잭션에서 커밋하여 이벤트가 두 번 반영되지 않도록 합니다.
+            watermark.last_event_id = events[-1].id
+            await session.commit()
+            applied += len(events)
+            if len(events) < batch_size:
+                break
+        return applied
+
+    # 집계 테이블 전체 재계산 (최초 실행 또는 수동 복구 시)
+    # 시험 일정별 집계는 현재 reservations 테이블에서, 일자별 집계는 이벤트 로그에서 계산합니다.
+    async def rebuild(self, session: AsyncSession) -> int:
+        # refresh/rebuild 가 동시에 집계 테이블을 고치지 않도록 watermark 행을 먼저 잠급니다.
+        watermark = await self._get_watermark(session)
+        if watermark is None:
+            await self._seed_watermark(session)
+            watermark = await self._get_watermark(session)
+
+        # watermark 는 생성 후 충분히 지나 커밋이 끝났다고 볼 수 있는 이벤트까지만 둡니다.
+        unsettled_id = await self._first_unsettled_event_id(session, 0, self.clock() - self.refresh_lag)
+        stmt = select(func.coalesce(func.max(ReservationEventORM.id), 0))
+        if unsettled_id is not None:
+            stmt = stmt.where(ReservationEventORM.id < unsettled_id)
+        last_event_id = (await session.execute(stmt)).scalar()
+
+        await session.execute(delete(ExamScheduleStatsORM))
+        await session.execute(delete(ReservationDailyStatsORM))
+
+        # 현재 예약 상태에서 watermark 이후 이벤트의 변경분을 되돌린 값을 집계합니다.
+        # (이후 refresh 에서 그 이벤트들이 다시 반영되므로, 같은 SQL 한 번으로 같은 스냅샷에서 계산해야 합니다)
+        states = union_all(
+            select(
+                ReservationORM.exam_schedule_id,
+                ReservationORM.status,
+                ReservationORM.num_examinees,
+                literal(1).label("sign")
+            ),
+            select(
+                ReservationEventORM.exam_schedule_id,
+                ReservationEventORM.status,
+                ReservationEventORM.num_examinees,
+                literal(-1)
+            ).where(
+                ReservationEventORM.id > last_event_id,
+                ReservationEventORM.event_type != ReservationEventType.deleted.value
+            ),
+            select(
+                ReservationEventORM.exam_schedule_id,
+                ReservationEventORM.prev_status,
+                ReservationEventORM.prev_num_examinees,
+                literal(1)
+            ).where(
+                ReservationEventORM.id > last_event_id,
+                ReservationEventORM.prev_status.isnot(None)
+            )
+        ).subquery()
+        stmt = select(
+            states.c.exam_schedule_id,
+            *[
+                func.coalesce(func.sum(case((states.c.status == status, value), else_=0)), 0)
+                for status in (ReservationStatus.pending.value, ReservationStatus.confirmed.value)
+                for value in (states.c.sign, states.c.sign * states.c.num_examinees)
+            ]
+        ).group_by(states.c.exam_schedule_id)
+        for exam_schedule_id, pending_cnt, pending_num, confirmed_cnt, confirmed_num in (await session.execute(stmt)).all():
+            session.add(ExamScheduleStatsORM(
+                exam_schedule_id=exam_schedule_id,
+                pending_reservations=pending_cnt,
+                pending_examinees=pending_num,
+                confirmed_reservations=confirmed_cnt,
+                confirmed_examinees=confirmed_num
+            ))
+
+        daily_deltas = defaultdict(lambda: defaultdict(int))
+        stmt = select(
+            ReservationEventORM.event_type,
+            ReservationEventORM.num_examinees,
+            ReservationEventORM.created_at
+        ).where(
+            ReservationEventORM.id <= last_event_id
+        ).order_by(ReservationEventORM.id).execution_options(yield_per=5000)
+        async for event_type, num_examinees, created_at in await session.stream(stmt):
+            daily = daily_deltas[(created_at.date(), event_type)]
+            daily["reservations"] += 1
+            daily["examinees"] += num_examinees
+        await self._apply_daily_deltas(session, daily_deltas)
+
+        watermark.last_event_id = last_event_id
+        await session.commit()
+        return last_event_id
+
+    async def list_exam_schedule_stats(self, session: AsyncSession):
+        stmt = select(
+            ExamScheduleORM.id,
+            ExamScheduleORM.exam_start,
+            ExamScheduleORM.exam_end,
+            ExamScheduleORM.capacity,
+            func.coalesce(ExamScheduleStatsORM.pending_reservations, 0),
+            func.coalesce(ExamScheduleStatsORM.pending_examinees, 0),
+            func.coalesce(ExamScheduleStatsORM.confirmed_reservations, 0),
+            func.coalesce(ExamScheduleStatsORM.confirmed_examinees, 0)
+        ).outerjoin(
+            ExamScheduleStatsORM, ExamScheduleStatsORM.exam_schedule_id == ExamScheduleORM.id
+        ).order_by(ExamScheduleORM.exam_start)
+        return (await session.execute(stmt)).all()
+
+    async def list_daily_stats(self, session: AsyncSession, since: date):
+        stmt = select(
+            ReservationDailyStatsORM.day,
+            ReservationDailyStatsORM.event_type,
+            ReservationDailyStatsORM.reservations,
+            ReservationDailyStatsORM.examinees
+        ).where(
+            ReservationDailyStatsORM.day >= since
+        ).order_by(ReservationDailyStatsORM.day, ReservationDailyStatsORM.event_type)
+        return (await session.execute(stmt)).all()
+
+    # after_id 이후 이벤트 중 cutoff 보다 늦게 생성된 첫 이벤트 id (없으면 None)
+    async def _first_unsettled_event_id(self, session: AsyncSession, after_id: int, cutoff: datetime) -> Optional[int]:
+        stmt = select(func.min(ReservationEventORM.id)).where(
+            ReservationEventORM.id > after_id,
+            ReservationEventORM.created_at > cutoff
+        )
+        return (await session.execute(stmt)).scalar()
+
+    # watermark 행이 없을 때만 생성하고, 이 호출이 만들었으면 True 를 반환합니다.
+    # (동시에 생성하려는 다른 트랜잭션은 PK 충돌 대신 상대가 끝날 때까지 기다린 뒤 아무것도 하지 않습니다)
+    async def _seed_watermark(self, session: AsyncSession) -> bool:
+        dialect = session.get_bind().dialect.name
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(StatsWatermarkORM).values(name=WATERMARK_NAME, last_event_id=0).on_conflict_do_nothing(
+            index_elements=[StatsWatermarkORM.name]
+        )
+        result = await session.execute(stmt)
+        return result.rowcount == 1
+
+    async def _get_watermark(self, session: AsyncSession):
+        # 동시에 여러 요청이 갱신하지 않도록 watermark 행을 잠급니다. (SQLite는 DB 단위 잠금으로 대체)
+        # 세션에 남아 있는 이전 값이 아니라 잠근 시점에 커밋된 값을 읽도록 populate_existing 을 사용합니다.
+        stmt = select(StatsWatermarkORM).where(
+            StatsWatermarkORM.name == WATERMARK_NAME
+        ).with_for_update().execution_options(populate_existing=True)
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+    async def _apply_schedule_deltas(self, session: AsyncSession, schedule_deltas: dict):
+        stmt = select(ExamScheduleStatsORM).where(ExamScheduleStatsORM.exam_schedule_id.in_(list(schedule_deltas)))
+        existing = {s.exam_schedule_id: s for s in (await session.execute(stmt)).scalars()}
+        for exam_schedule_id, deltas in schedule_deltas.items():
+            stats = existing.get(exam_schedule_id)
+            if stats is None:
+                stats = ExamScheduleStatsORM(
+                    exam_schedule_id=exam_schedule_id,
+                    pending_reservations=0,
+                    pending_examinees=0,
+                    confirmed_reservations=0,
+                    confirmed_examinees=0
+                )
+                session.add(stats)
+            for column, delta in deltas.items():
+                setattr(stats, column, getattr(stats, column) + delta)
+
+    async def _apply_daily_deltas(self, session: AsyncSession, daily_deltas: dict):
+        if not daily_deltas:
+            return
+        days = {day for day, _ in daily_deltas}
+        stmt = select(ReservationDailyStatsORM).where(ReservationDailyStatsORM.day.in_(days))
+        existing = {(s.day, s.event_type): s for s in (await session.execute(stmt)).scalars()}
+        for key, deltas in daily_deltas.items():
+            stats = existing.get(key)
+            if stats is None:
+                stats = ReservationDailyStatsORM(day=key[0], event_type=key[1], reservations=0, examinees=0)
+                session.add(stats)
+            stats.reservations += deltas["reservations"]
+            stats.examinees += deltas["examinees"]
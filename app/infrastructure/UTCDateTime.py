@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+# 모든 테이블에서 공통으로 사용하는 UTC 시각 컬럼 타입
+# 저장 시 UTC로 변환하고 조회 시 항상 UTC tzinfo가 붙은 datetime을 반환하므로,
+# 서비스/API 계층에서 행마다 tzinfo를 보정할 필요가 없습니다.
+# (timezone 정보가 없는 값은 UTC로 간주합니다)
+class UTCDateTime(TypeDecorator):
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        elif value.tzinfo is not timezone.utc:
+            value = value.astimezone(timezone.utc)
+        # SQLite는 timezone 타입이 없으므로 UTC 기준 naive 값으로 저장합니다.
+        if dialect.name == "sqlite":
+            return value.replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        if value.tzinfo is not timezone.utc:
+            return value.astimezone(timezone.utc)
+        return value
@@ -0,0 +1,201 @@
+import os
+import zlib
+from typing import Dict, List, Optional
+
+# 선택적 압축 라이브러리 (설치되어 있을 때만 사용)
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 설치 여부에 따라 달라짐
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 설치 여부에 따라 달라짐
+    zstandard = None
+
+# 스트리밍 압축기: compress()는 지금까지 받은 데이터를 바로 내보낼 수 있도록 flush 하고,
+# finish()는 스트림을 종료합니다.
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+# 사용 가능한 인코딩 → (압축기, 기본 압축 레벨)
+COMPRESSORS = {"gzip": (GzipCompressor, 6)}
+if brotli is not None:
+    COMPRESSORS["br"] = (BrotliCompressor, 4)
+if zstandard is not None:
+    COMPRESSORS["zstd"] = (ZstdCompressor, 3)
+
+# 이미 압축된 형식이라 다시 압축해도 이득이 없는 Content-Type 은 제외합니다.
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    encodings = {}
+    for item in header.split(","):
+        parts = item.strip().split(";")
+        name = parts[0].strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        encodings[name] = q
+    return encodings
+
+# Response 압축 ASGI Middleware
+# - Accept-Encoding 과 서버 선호 순서(zstd > br > gzip)로 인코딩을 선택합니다.
+# - 응답은 minimum_size 이상일 때만 압축합니다. (여러 조각으로 오는 응답도 minimum_size 까지만 모아서 판단)
+# - StreamingResponse 처럼 여러 조각으로 오는 응답은 이후 조각마다 압축해서 바로 내보내므로 전체 본문을 모아두지 않습니다.
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        encodings: Optional[List[str]] = None,
+        levels: Optional[Dict[str, int]] = None
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = [e for e in (encodings or ["zstd", "br", "gzip"]) if e in COMPRESSORS]
+        self.levels = {name: default for name, (_, default) in COMPRESSORS.items()}
+        self.levels.update(levels or {})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.levels[encoding], self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+    def _select_encoding(self, scope) -> Optional[str]:
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accepted = parse_accept_encoding(value.decode("latin-1"))
+                wildcard = accepted.get("*", 0.0)
+                for name in self.encodings:
+                    if accepted.get(name, wildcard) > 0:
+                        return name
+                return None
+        return None
+
+class _CompressionResponder:
+    def __init__(self, send, encoding: str, level: int, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message = None
+        self.buffer = bytearray()
+        self.compressor = None
+        self.passthrough = False
+
+    async def send(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 본문 크기를 보고 압축 여부를 결정하므로 헤더 전송을 잠시 미룹니다.
+            self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            if not self._is_compressible(self.start_message):
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            # 스트리밍 응답도 minimum_size 만큼 모이거나 스트림이 끝날 때까지 조각을 모아 두고 결정합니다.
+            self.buffer += body
+            if more_body and len(self.buffer) < self.minimum_size:
+                return
+            start, self.start_message = self.start_message, None
+            body, self.buffer = bytes(self.buffer), bytearray()
+            if len(body) < self.minimum_size:
+                # 스트림이 minimum_size 전에 끝난 작은 응답은 모은 본문을 그대로 한 번에 보냅니다.
+                self.passthrough = True
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            compressor_class, _ = COMPRESSORS[self.encoding]
+            self.compressor = compressor_class(self.level)
+            if not more_body:
+                compressed = self.compressor.finish(body)
+                await self._send(self._compressed_start(start, len(compressed)))
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            await self._send(self._compressed_start(start, None))
+
+        if more_body:
+            chunk = self.compressor.compress(body)
+            if chunk:
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": True})
+        else:
+            await self._send({"type": "http.response.body", "body": self.compressor.finish(body)})
+
+    def _is_compressible(self, start) -> bool:
+        headers = {k.lower(): v for k, v in start.get("headers", [])}
+        if b"content-encoding" in headers:
+            return False
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compressed_start(self, start, content_length: Optional[int]):
+        headers = [
+            (k, v) for k, v in start.get("headers", [])
+            if k.lower() not in (b"content-length", b"content-encoding")
+        ]
+        headers.append((b"content-encoding", self.encoding.encode()))
+        headers.append((b"vary", b"Accept-Encoding"))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        return {**start, "headers": headers}
+
+# 환경 변수 기반 설정
+# COMPRESSION_MINIMUM_SIZE: 압축할 최소 응답 크기(byte), COMPRESSION_ENCODINGS: 선호 순서 (예: "zstd,br,gzip")
+def compression_settings() -> dict:
+    encodings = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    return {
+        "minimum_size": int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024")),
+        "encodings": [e.strip() for e in encodings.split(",") if e.strip()],
+    }
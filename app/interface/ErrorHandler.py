@@ -0,0 +1,117 @@
+from collections import Counter
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import (
+    SQLAlchemyError,
+    IntegrityError,
+    DataError,
+    OperationalError,
+    InterfaceError,
+    DisconnectionError,
+    TimeoutError as PoolTimeoutError
+)
+from app.domain.Exception import (
+    DomainException,
+    NotFoundException,
+    CapacityExceededException,
+    PermissionDeniedException,
+    InvalidStateException,
+    ValidationException
+)
+
+# 도메인 예외 → HTTP 상태 코드 (정의되지 않은 DomainException 은 400)
+DOMAIN_STATUS_CODES = {
+    NotFoundException: 404,
+    PermissionDeniedException: 403,
+    CapacityExceededException: 409,
+    InvalidStateException: 409,
+    ValidationException: 400,
+}
+
+# 인프라 장애(DB 연결 실패, 커넥션 풀 타임아웃 등) 시 클라이언트에게 알려줄 재시도 대기 시간(초)
+RETRY_AFTER_SECONDS = 5
+
+# 재시도하면 해결될 수 있는 일시적 장애 (DB 연결 실패/끊김, 커넥션 풀 타임아웃 등) → 503 + Retry-After
+INFRASTRUCTURE_ERRORS = (
+    OperationalError,
+    InterfaceError,
+    DisconnectionError,
+    PoolTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# 오류 발생 횟수 집계 (category: "domain", "infrastructure" 또는 "internal")
+# 부하로 인한 장애(infrastructure)와 사용자 오류(domain), 코드/쿼리 결함(internal)을 구분해서 볼 수 있습니다.
+class ErrorMetrics:
+    def __init__(self):
+        self._counts = Counter()
+
+    def record(self, category: str, code: str):
+        self._counts[(category, code)] += 1
+
+    def snapshot(self) -> dict:
+        result = {}
+        for (category, code), count in self._counts.items():
+            result.setdefault(category, {})[code] = count
+        return result
+
+    def reset(self):
+        self._counts.clear()
+
+error_metrics = ErrorMetrics()
+
+def _status_code_for(exc: DomainException) -> int:
+    for exc_type in type(exc).__mro__:
+        if exc_type in DOMAIN_STATUS_CODES:
+            return DOMAIN_STATUS_CODES[exc_type]
+    return 400
+
+async def domain_exception_handler(request: Request, exc: DomainException) -> JSONResponse:
+    error_metrics.record("domain", exc.code)
+    return JSONResponse(
+        status_code=_status_code_for(exc),
+        content={"detail": str(exc), "code": exc.code}
+    )
+
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    # 제약 조건 위반은 재시도해도 해결되지 않으므로 503이 아닌 409로 응답합니다.
+    error_metrics.record("domain", "conflict")
+    return JSONResponse(
+        status_code=409,
+        content={"detail": "Request conflicts with existing data", "code": "conflict"}
+    )
+
+async def data_error_handler(request: Request, exc: DataError) -> JSONResponse:
+    # 컬럼 범위/형식에 맞지 않는 값은 재시도해도 해결되지 않는 입력 오류입니다.
+    error_metrics.record("domain", "invalid_data")
+    return JSONResponse(
+        status_code=400,
+        content={"detail": "Invalid data for this request", "code": "invalid_data"}
+    )
+
+async def infrastructure_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    code = "database_unavailable" if isinstance(exc, SQLAlchemyError) else "service_unavailable"
+    error_metrics.record("infrastructure", code)
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service temporarily unavailable", "code": code},
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+    )
+
+async def database_error_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    # 잘못된 쿼리/ORM 사용 등 일시적 장애가 아닌 DB 오류는 재시도를 유도하지 않도록 500으로 응답합니다.
+    error_metrics.record("internal", "database_error")
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error", "code": "database_error"}
+    )
+
+def register_exception_handlers(app: FastAPI):
+    app.add_exception_handler(DomainException, domain_exception_handler)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
+    app.add_exception_handler(DataError, data_error_handler)
+    for exc_type in INFRASTRUCTURE_ERRORS:
+        app.add_exception_handler(exc_type, infrastructure_exception_handler)
+    # 위에서 처리되지 않은 나머지 SQLAlchemyError (ProgrammingError, StatementError, InvalidRequestError, NoResultFound 등)
+    app.add_exception_handler(SQLAlchemyError, database_error_handler)
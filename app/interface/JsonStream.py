@@ -0,0 +1,38 @@
+from typing import AsyncIterator, Callable
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 스트리밍 응답 한 조각의 목표 크기 (CompressionMiddleware 가 조각마다 압축해서 바로 내보냄)
+CHUNK_SIZE = 64 * 1024
+
+# 큰 목록을 JSON 배열 조각으로 나눠 보내는 응답
+# 세션은 요청 의존성이 아니라 본문을 모두 보낼 때까지 이 스트림이 직접 열고 닫습니다.
+async def streaming_json_response(
+    session_factory,
+    rows: Callable[[AsyncSession], AsyncIterator[dict]],
+    chunk_size: int = CHUNK_SIZE
+) -> StreamingResponse:
+    chunks = _json_array_chunks(session_factory, rows, chunk_size)
+    # 헤더(200)를 보내기 전에 첫 조각까지 만들어 두어, 조회 실패(DB 장애 등)는 기존 예외 핸들러(503)로 처리되게 합니다.
+    first = await chunks.__anext__()
+    return StreamingResponse(_prepend(first, chunks), media_type="application/json")
+
+async def _json_array_chunks(session_factory, rows, chunk_size: int):
+    async with session_factory() as session:
+        buffer = bytearray(b"[")
+        separator = b""
+        async for row in rows(session):
+            buffer += separator
+            buffer += to_json(row)
+            separator = b","
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]"
+        yield bytes(buffer)
+
+async def _prepend(first: bytes, chunks):
+    yield first
+    async for chunk in chunks:
+        yield chunk
@@ -0,0 +1,204 @@
+import logging
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from app.interface.ErrorHandler import error_metrics
+
+logger = logging.getLogger(__name__)
+
+# Token Bucket 저장소 인터페이스
+# consume()은 요청을 허용하면 0을, 거절하면 다음 토큰까지 남은 시간(초)을 반환합니다.
+class TokenBucketBackend(ABC):
+    @abstractmethod
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        ...
+
+# 단일 프로세스용 In-Memory Token Bucket
+# 버킷은 (남은 토큰, 마지막 갱신 시각) 튜플 하나로만 저장하여 메모리를 작게 유지합니다.
+# 키 개수가 max_keys 에 도달하면 가장 오래 사용되지 않은 버킷 하나를 O(1)로 제거합니다(LRU).
+# (키는 클라이언트가 정하는 X-User-Id 에서 오므로 제거 비용이 저장된 키 개수에 비례하면 안 됩니다)
+class InMemoryTokenBucketBackend(TokenBucketBackend):
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets = OrderedDict()
+
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        # await 없이 한 번에 계산하므로 이벤트 루프 안에서 원자적으로 동작합니다.
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                # 제거된 키가 다시 오면 가득 찬 버킷으로 시작하므로, max_keys 는 동시에 활성인 키 수보다 크게 둡니다.
+                self._buckets.popitem(last=False)
+            tokens = float(burst)
+        else:
+            self._buckets.move_to_end(key)
+            tokens, last = bucket
+            tokens = min(float(burst), tokens + (now - last) * rate)
+
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            return 0.0
+        self._buckets[key] = (tokens, now)
+        return (1 - tokens) / rate
+
+# 여러 worker가 제한을 공유할 때 사용하는 Redis Token Bucket (redis 패키지 필요)
+class RedisTokenBucketBackend(TokenBucketBackend):
+    SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+    local b = redis.call('HMGET', KEYS[1], 't', 'l')
+    local tokens = tonumber(b[1]) or burst
+    local last = tonumber(b[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - last) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        wait = (1 - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 't', tokens, 'l', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+        self._script = self.client.register_script(self.SCRIPT)
+
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        wait = await self._script(keys=[self.prefix + key], args=[rate, burst])
+        return float(wait)
+
+# 환경 변수에 따라 Backend 선택 (RATE_LIMIT_REDIS_URL 이 있으면 Redis 공유 Backend 사용)
+def create_rate_limit_backend() -> TokenBucketBackend:
+    redis_url = os.getenv("RATE_LIMIT_REDIS_URL")
+    if redis_url:
+        return RedisTokenBucketBackend(redis_url)
+    return InMemoryTokenBucketBackend()
+
+def _segments(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
+# path 는 경로 세그먼트 단위로 앞부분이 일치하면 적용됩니다. ("{...}" 세그먼트는 아무 값과 일치)
+# 예) "/reservations" 는 "/reservations", "/reservations/1" 과 일치하고 "/reservationsX" 와는 일치하지 않습니다.
+class RateLimitRule:
+    __slots__ = ("method", "path", "rate", "burst", "_segments")
+
+    def __init__(self, method: str, path: str, rate: float, burst: int):
+        self.method = method
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self._segments = _segments(path)
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.method != "*" and self.method != method:
+            return False
+        segments = _segments(path)
+        if len(segments) < len(self._segments):
+            return False
+        return all(
+            expected == actual or expected.startswith("{")
+            for expected, actual in zip(self._segments, segments)
+        )
+
+# 라우트별 기본 제한 (쓰기 요청은 더 엄격하게, 위에서부터 먼저 일치하는 규칙 적용)
+# 관리자 예약 확정은 고객 예약 생성(POST /reservations)과 별도의 버킷을 사용하도록 먼저 둡니다.
+DEFAULT_RULES: List[RateLimitRule] = [
+    RateLimitRule("POST", "/reservations/{reservation_id}/confirm", rate=5.0, burst=20),
+    RateLimitRule("POST", "/reservations", rate=1.0, burst=5),
+    RateLimitRule("PUT", "/reservations", rate=1.0, burst=5),
+    RateLimitRule("DELETE", "/reservations", rate=1.0, burst=5),
+    RateLimitRule("GET", "/exam-schedules", rate=10.0, burst=20),
+    RateLimitRule("*", "/", rate=20.0, burst=40),
+]
+
+# Rate Limit ASGI Middleware
+# 라우팅/의존성 주입(get_session) 이전에 동작하므로 거절된 요청은 DB 세션을 열지 않습니다.
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app,
+        backend: Optional[TokenBucketBackend] = None,
+        rules: Optional[List[RateLimitRule]] = None,
+        ip_multiplier: float = 4.0
+    ):
+        self.app = app
+        self.backend = backend or InMemoryTokenBucketBackend()
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        # 하나의 IP 뒤에 여러 사용자가 있을 수 있으므로 IP 제한은 사용자 제한보다 느슨하게 둡니다.
+        self.ip_multiplier = ip_multiplier
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope["method"], scope["path"])
+        if rule is not None:
+            wait = await self._check(scope, rule)
+            if wait > 0:
+                await self._reject(send, wait)
+                return
+        await self.app(scope, receive, send)
+
+    def _match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+    async def _check(self, scope, rule: RateLimitRule) -> float:
+        try:
+            return await self._consume(scope, rule)
+        except Exception:
+            # 저장소(Redis 등) 장애로 모든 요청이 500이 되지 않도록 제한 없이 통과시키고(fail open) 장애로 집계합니다.
+            logger.warning("Rate limit backend unavailable, allowing request", exc_info=True)
+            error_metrics.record("infrastructure", "rate_limit_unavailable")
+            return 0.0
+
+    async def _consume(self, scope, rule: RateLimitRule) -> float:
+        route = f"{rule.method}:{rule.path}"
+        user_id = _header(scope, b"x-user-id")
+        if user_id is not None:
+            wait = await self.backend.consume(f"{route}:user:{user_id}", rule.rate, rule.burst)
+            if wait > 0:
+                return wait
+
+        client = scope.get("client")
+        if client:
+            return await self.backend.consume(
+                f"{route}:ip:{client[0]}",
+                rule.rate * self.ip_multiplier,
+                int(rule.burst * self.ip_multiplier)
+            )
+        return 0.0
+
+    async def _reject(self, send, wait: float):
+        body = b'{"detail":"Too Many Requests"}'
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(wait))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
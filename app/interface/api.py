@@ -1,27 +1,56 @@
 from fastapi import FastAPI, Depends, HTTPException, Header, status
+from functools import lru_cache
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.Database import async_session, engine, Base
 from app.infrastructure.ReservationRepository import ReservationRepository
+from app.infrastructure.StatisticsRepository import StatisticsRepository
 from app.application.ReservationService import ReservationService
 from app.application.AdminReservationService import AdminReservationService
 from app.application.ExamScheduleService import ExamScheduleService
+from app.application.StatisticsService import StatisticsService
 from app.application.ReservationDto import ReservationCreateDTO, ReservationUpdateDTO
 from app.application.ExamScheduleDto import ExamScheduleCreateDTO, ExamScheduleResponseDTO
+from app.interface.RateLimit import RateLimitMiddleware, create_rate_limit_backend
+from app.interface.Compression import CompressionMiddleware, compression_settings
+from app.interface.ErrorHandler import register_exception_handlers, error_metrics
+from app.interface.JsonStream import streaming_json_response
+from app.domain.Exception import PermissionDeniedException
 import uvicorn
 
 app = FastAPI(title="시험 일정 예약 시스템 API")
 
+# 큰 목록 응답 압축 (gzip, 설치되어 있으면 zstd/br)
+app.add_middleware(CompressionMiddleware, **compression_settings())
+
+# 사용자/IP 단위 Rate Limit (DB 세션을 열기 전에 거절, 가장 바깥쪽 Middleware)
+app.add_middleware(RateLimitMiddleware, backend=create_rate_limit_backend())
+
+# 도메인/인프라 예외를 상태 코드와 오류 코드로 변환
+register_exception_handlers(app)
+
 # DB 세션 의존성
 async def get_session():
     async with async_session() as session:
         yield session
 
+# 스트리밍 응답용 세션 팩토리 의존성 (세션은 응답 본문을 모두 보낸 뒤 닫힙니다)
+async def get_session_factory():
+    return async_session
+
 # 단순 사용자 모델 (실제 프로젝트에서는 JWT/OAuth2 사용 권장)
 class User:
+    __slots__ = ("user_id", "role")
+
     def __init__(self, user_id: str, role: str):
         self.user_id = user_id
         self.role = role
 
+# 동일한 (user_id, role) 조합은 같은 User 객체를 재사용하여 요청마다 객체를 만들지 않습니다.
+@lru_cache(maxsize=4096)
+def _cached_user(user_id: str, role: str) -> User:
+    return User(user_id=user_id, role=role)
+
 # 현재 사용자 의존성 (헤더 사용)
 async def get_current_user(
     x_user_id: Optional[str] = Header(None),
@@ -29,22 +58,31 @@ async def get_current_user(
 ):
     if x_user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="X-User-Id header missing")
-    return User(user_id=x_user_id, role=x_user_role)
+    return _cached_user(x_user_id, x_user_role)
+
+# Repository/Service는 상태가 없으므로 애플리케이션 전체에서 하나의 인스턴스를 공유합니다.
+# (세션은 get_session 으로 요청마다 열고 각 메서드 호출 시 전달합니다)
+reservation_repository = ReservationRepository()
+reservation_service = ReservationService(reservation_repository)
+admin_reservation_service = AdminReservationService(reservation_repository)
+exam_schedule_service = ExamScheduleService(reservation_repository)
+statistics_service = StatisticsService(StatisticsRepository())
 
 # ReservationService 의존성 주입
-async def get_reservation_service(session=Depends(get_session)):
-    repo = ReservationRepository(session)
-    return ReservationService(repo)
+async def get_reservation_service():
+    return reservation_service
 
 # AdminReservationService 의존성 주입
-async def get_admin_reservation_service(session=Depends(get_session)):
-    repo = ReservationRepository(session)
-    return AdminReservationService(repo)
+async def get_admin_reservation_service():
+    return admin_reservation_service
 
 # ExamScheduleService 의존성 주입
-async def get_exam_schedule_service(session=Depends(get_session)):
-    repo = ReservationRepository(session)
-    return ExamScheduleService(repo)
+async def get_exam_schedule_service():
+    return exam_schedule_service
+
+# StatisticsService 의존성 주입
+async def get_statistics_service():
+    return statistics_service
 
 # API 엔드포인트
 
@@ -53,25 +91,21 @@ async def get_exam_schedule_service(session=Depends(get_session)):
 async def create_reservation(
     dto: ReservationCreateDTO,
     current_user: User = Depends(get_current_user),
-    service: ReservationService = Depends(get_reservation_service)
+    service: ReservationService = Depends(get_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
-    try:
-        reservation = await service.create_reservation(current_user.user_id, dto)
-        return reservation
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    reservation = await service.create_reservation(session, current_user.user_id, dto)
+    return reservation
 
 # 고객: 내 예약 조회
 @app.get("/reservations", response_model=List[dict])
 async def get_my_reservations(
     current_user: User = Depends(get_current_user),
-    service: ReservationService = Depends(get_reservation_service)
+    service: ReservationService = Depends(get_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
-    try:
-        reservations = await service.get_my_reservations(current_user.user_id)
-        return reservations
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    reservations = await service.get_my_reservations(session, current_user.user_id)
+    return reservations
 
 # 고객: 예약 수정
 @app.put("/reservations/{reservation_id}", response_model=dict)
@@ -79,83 +113,135 @@ async def update_reservation(
     reservation_id: int,
     dto: ReservationUpdateDTO,
     current_user: User = Depends(get_current_user),
-    service: ReservationService = Depends(get_reservation_service)
+    service: ReservationService = Depends(get_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
-    try:
-        reservation = await service.update_reservation(reservation_id, current_user.user_id, dto)
-        return reservation
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    reservation = await service.update_reservation(session, reservation_id, current_user.user_id, dto)
+    return reservation
 
 # 고객: 예약 삭제
 @app.delete("/reservations/{reservation_id}")
 async def delete_reservation(
     reservation_id: int,
     current_user: User = Depends(get_current_user),
-    service: ReservationService = Depends(get_reservation_service)
+    service: ReservationService = Depends(get_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
-    try:
-        await service.delete_reservation(reservation_id, current_user.user_id)
-        return {"detail": "Reservation deleted"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    await service.delete_reservation(session, reservation_id, current_user.user_id)
+    return {"detail": "Reservation deleted"}
 
 # 관리자: 예약 확정
 @app.post("/reservations/{reservation_id}/confirm", response_model=dict)
 async def confirm_reservation(
     reservation_id: int,
     current_user: User = Depends(get_current_user),
-    service: AdminReservationService = Depends(get_admin_reservation_service)
+    service: AdminReservationService = Depends(get_admin_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
     if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Only admin can confirm reservations")
-    try:
-        reservation = await service.confirm_reservation(reservation_id)
-        return reservation
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-# 관리자: 전체 예약 조회
+        raise PermissionDeniedException("Only admin can confirm reservations")
+    reservation = await service.confirm_reservation(session, reservation_id)
+    return reservation
+
+# 관리자: 전체 예약 조회 (JSON 배열을 조각으로 나눠 스트리밍, 압축도 조각마다 수행)
 @app.get("/admin/reservations", response_model=List[dict])
 async def get_all_reservations(
     current_user: User = Depends(get_current_user),
-    service: AdminReservationService = Depends(get_admin_reservation_service)
+    service: AdminReservationService = Depends(get_admin_reservation_service),
+    session_factory = Depends(get_session_factory)
+):
+    if current_user.role != "admin":
+        raise PermissionDeniedException("Only admin can view all reservations")
+    return await streaming_json_response(session_factory, service.stream_all_reservations)
+
+# 관리자: 과거(Archive) 예약 조회 (after_id/limit Keyset Pagination, 시험 일정/사용자 필터)
+@app.get("/admin/reservations/archive", response_model=List[dict])
+async def get_archived_reservations(
+    after_id: int = 0,
+    limit: int = 100,
+    exam_schedule_id: Optional[int] = None,
+    user_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    service: AdminReservationService = Depends(get_admin_reservation_service),
+    session: AsyncSession = Depends(get_session)
+):
+    if current_user.role != "admin":
+        raise PermissionDeniedException("Only admin can view archived reservations")
+    reservations = await service.get_archived_reservations(
+        session, after_id=after_id, limit=limit, exam_schedule_id=exam_schedule_id, user_id=user_id
+    )
+    return reservations
+
+# 관리자: 종료된 시험 일정 Archive 배치 실행 (스케줄러/cron에서 주기적으로 호출)
+@app.post("/admin/exam-schedules/archive", response_model=dict)
+async def archive_completed_schedules(
+    batch_size: int = 100,
+    current_user: User = Depends(get_current_user),
+    service: AdminReservationService = Depends(get_admin_reservation_service),
+    session: AsyncSession = Depends(get_session)
 ):
     if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Only admin can view all reservations")
-    try:
-        reservations = await service.get_all_reservations()
-        return reservations
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise PermissionDeniedException("Only admin can archive exam schedules")
+    result = await service.archive_completed_schedules(session, batch_size=batch_size)
+    return result
 
 # 관리자: 시험 일정 생성
 @app.post("/admin/exam-schedules", response_model=ExamScheduleResponseDTO)
 async def create_exam_schedule(
     dto: ExamScheduleCreateDTO,
     current_user: User = Depends(get_current_user),
-    service: ExamScheduleService = Depends(get_exam_schedule_service)
+    service: ExamScheduleService = Depends(get_exam_schedule_service),
+    session: AsyncSession = Depends(get_session)
 ):
     if current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Only admin can create exam schedules")
-    try:
-        schedule = await service.create_exam_schedule(dto)
-        return schedule
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-# 시험 일정 조회 (모든 사용자)
+        raise PermissionDeniedException("Only admin can create exam schedules")
+    schedule = await service.create_exam_schedule(session, dto)
+    return schedule
+
+# 시험 일정 조회 (모든 사용자, JSON 배열을 조각으로 나눠 스트리밍)
 @app.get("/exam-schedules", response_model=List[dict])
 async def get_exam_schedules(
-    service: ExamScheduleService = Depends(get_exam_schedule_service)
+    service: ExamScheduleService = Depends(get_exam_schedule_service),
+    session_factory = Depends(get_session_factory)
 ):
-    try:
-        schedules = await service.get_exam_schedules()
-        return schedules
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await streaming_json_response(session_factory, service.stream_exam_schedules)
+
+# 관리자: 대시보드 통계 조회 (시험 일정별 충원율/상태별 인원, 일자별 예약 추이)
+@app.get("/admin/statistics", response_model=dict)
+async def get_statistics(
+    days: int = 30,
+    current_user: User = Depends(get_current_user),
+    service: StatisticsService = Depends(get_statistics_service),
+    session: AsyncSession = Depends(get_session)
+):
+    if current_user.role != "admin":
+        raise PermissionDeniedException("Only admin can view statistics")
+    statistics = await service.get_statistics(session, days=days)
+    return statistics
+
+# 관리자: 통계 집계 테이블 전체 재계산
+@app.post("/admin/statistics/rebuild", response_model=dict)
+async def rebuild_statistics(
+    current_user: User = Depends(get_current_user),
+    service: StatisticsService = Depends(get_statistics_service),
+    session: AsyncSession = Depends(get_session)
+):
+    if current_user.role != "admin":
+        raise PermissionDeniedException("Only admin can rebuild statistics")
+    result = await service.rebuild_statistics(session)
+    return result
+
+# 관리자: 오류 발생 현황 조회 (도메인 오류 / 인프라 장애 구분)
+@app.get("/admin/metrics/errors", response_model=dict)
+async def get_error_metrics(
+    current_user: User = Depends(get_current_user)
+):
+    if current_user.role != "admin":
+        raise PermissionDeniedException("Only admin can view error metrics")
+    return error_metrics.snapshot()
 
 # 애플리케이션 시작 시 테이블 생성
+# (기존 DB의 컬럼 타입/인덱스 변경은 worker 마다 실행되지 않도록 배포 시 python -m app.infrastructure.Migrations 로 한 번만 실행합니다)
 @app.on_event("startup")
 async def on_startup():
     async with engine.begin() as conn:
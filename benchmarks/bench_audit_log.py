@@ -0,0 +1,88 @@
+# Audit Event Log 기록 비용 벤치마크
+#
+# 실행: python benchmarks/bench_audit_log.py [반복 횟수]
+#
+# - confirm    : AdminReservationService.confirm_reservation 지연 시간 (이벤트 기록 on/off 비교)
+# - append     : 트랜잭션당 batch 크기별 이벤트 INSERT 처리량
+# 파일 기반 SQLite(WAL) 위에서 측정합니다. DATABASE_URL 로 다른 DB를 지정할 수 있습니다.
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DB_FILE = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{DB_FILE}")
+os.environ.setdefault("SQL_ECHO", "false")
+
+from app.infrastructure.Database import Base, engine, async_session  # noqa: E402
+from app.infrastructure.ReservationRepository import ReservationRepository, ReservationEventORM  # noqa: E402
+from app.application.AdminReservationService import AdminReservationService  # noqa: E402
+from app.domain.Reservation import Reservation  # noqa: E402
+
+async def reset():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+async def bench_confirm(repository: ReservationRepository, n: int) -> list:
+    service = AdminReservationService(repository)
+    async with async_session() as session:
+        exam_start = datetime.now(timezone.utc) + timedelta(days=30)
+        schedule = await repository.create_exam_schedule(
+            session, exam_start=exam_start, exam_end=exam_start + timedelta(hours=2), capacity=10_000_000
+        )
+        ids = [
+            (await repository.create(session, Reservation(user_id="user1", exam_schedule_id=schedule.id, num_examinees=1))).id
+            for _ in range(n)
+        ]
+
+    timings = []
+    for reservation_id in ids:
+        async with async_session() as session:
+            start = time.perf_counter()
+            await service.confirm_reservation(session, reservation_id)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+class NoAuditRepository(ReservationRepository):
+    def _append_event(self, *args, **kwargs):
+        pass
+
+async def bench_append(n: int, batch_size: int) -> float:
+    start = time.perf_counter()
+    async with async_session() as session:
+        for offset in range(0, n, batch_size):
+            session.add_all([
+                ReservationEventORM(reservation_id=i, exam_schedule_id=1, event_type="created", status="pending", num_examinees=1)
+                for i in range(offset, min(offset + batch_size, n))
+            ])
+            await session.commit()
+    return n / (time.perf_counter() - start)
+
+def summary(name: str, timings: list):
+    timings = sorted(timings)
+    p50 = statistics.median(timings) * 1e3
+    p95 = timings[int(len(timings) * 0.95) - 1] * 1e3
+    print(f"[confirm] {name:9s} p50 {p50:7.3f} ms  p95 {p95:7.3f} ms")
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    await reset()
+    await bench_confirm(ReservationRepository(), 50)  # warm-up
+    for name, repository in (("no-audit", NoAuditRepository()), ("audit", ReservationRepository())):
+        await reset()
+        summary(name, await bench_confirm(repository, n))
+
+    for batch_size in (1, 10, 100, 1000):
+        await reset()
+        rate = await bench_append(n * 20, batch_size)
+        print(f"[append]  batch {batch_size:5d} {rate:12,.0f} events/s")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
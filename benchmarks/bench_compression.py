@@ -0,0 +1,77 @@
+# 응답 압축 CPU 비용 vs 전송량 벤치마크
+#
+# 실행: python benchmarks/bench_compression.py [예약 개수]
+#
+# /admin/reservations 형태의 JSON 목록을 만들어 인코딩/레벨별로
+# 압축 시간, 압축률, 대역폭별 예상 전송 시간(압축 시간 + 전송 시간)을 비교합니다.
+# 한 번에 압축하는 경우(oneshot)와 64KB 조각으로 스트리밍 압축하는 경우(stream)를 모두 측정합니다.
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.interface.Compression import COMPRESSORS  # noqa: E402
+
+LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 9], "zstd": [1, 3, 9]}
+BANDWIDTHS_MBPS = [10, 100, 1000]
+CHUNK_SIZE = 64 * 1024
+
+def make_payload(n: int) -> bytes:
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    rows = [
+        {
+            "id": i,
+            "user_id": str(i % 10_000),
+            "exam_schedule_id": i % 300 + 1,
+            "exam_start": (now + timedelta(days=i % 300)).isoformat(),
+            "exam_end": (now + timedelta(days=i % 300, hours=2)).isoformat(),
+            "num_examinees": i % 50 + 1,
+            "status": "confirmed" if i % 3 else "pending",
+            "created_at": (now - timedelta(minutes=i)).isoformat(),
+            "updated_at": (now - timedelta(minutes=i // 2)).isoformat(),
+        }
+        for i in range(n)
+    ]
+    return json.dumps(rows).encode()
+
+def measure(compressor_class, level: int, payload: bytes, streamed: bool, rounds: int = 3):
+    chunks = [payload[i:i + CHUNK_SIZE] for i in range(0, len(payload), CHUNK_SIZE)]
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        compressor = compressor_class(level)
+        if streamed:
+            size = sum(len(compressor.compress(chunk)) for chunk in chunks[:-1])
+            size += len(compressor.finish(chunks[-1]))
+        else:
+            size = len(compressor.finish(payload))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, size
+
+def transfer_ms(size: int, mbps: int) -> float:
+    return size * 8 / (mbps * 1_000_000) * 1e3
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    payload = make_payload(n)
+    print(f"payload: {n} reservations, {len(payload) / 1024:.0f} KB; encoders: {', '.join(COMPRESSORS)}")
+    header = "encoding       mode     cpu(ms)   size(KB)  ratio " + " ".join(f"{m:>7d}Mbps" for m in BANDWIDTHS_MBPS)
+    print(header)
+    print(f"{'identity':14s} {'-':8s} {0:8.1f} {len(payload) / 1024:10.0f} {1:6.2f} "
+          + " ".join(f"{transfer_ms(len(payload), m):9.1f}ms" for m in BANDWIDTHS_MBPS))
+
+    for name, (compressor_class, _) in COMPRESSORS.items():
+        for level in LEVELS[name]:
+            for streamed in (False, True):
+                cpu, size = measure(compressor_class, level, payload, streamed)
+                totals = " ".join(f"{cpu * 1e3 + transfer_ms(size, m):9.1f}ms" for m in BANDWIDTHS_MBPS)
+                mode = "stream" if streamed else "oneshot"
+                print(f"{name + '-' + str(level):14s} {mode:8s} {cpu * 1e3:8.1f} {size / 1024:10.0f} "
+                      f"{len(payload) / size:6.2f} {totals}")
+
+if __name__ == "__main__":
+    main()
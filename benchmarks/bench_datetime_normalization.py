@@ -0,0 +1,132 @@
+# 시험 일정 목록 조회의 datetime 변환 비용 벤치마크
+#
+# 실행: python benchmarks/bench_datetime_normalization.py [일정 개수]
+#
+# SQLite(aiosqlite) 파일 DB에 시험 일정을 넣고, 두 방식 모두 실제 Repository 쿼리로 행을 읽어 JSON 직렬화까지 측정합니다.
+# - legacy : 기존 DateTime 컬럼 처리(naive 값 반환) + 서비스에서 행마다 tzinfo 보정 + isoformat 변환
+# - utc    : ReservationRepository.get_exam_schedules (UTCDateTime.process_result_value 에서 행마다 UTC 변환)
+#            + ExamScheduleService.get_exam_schedules (보정 루프 없음)
+# 두 방식은 같은 SQL을 실행하고 결과 컬럼의 타입 처리만 다르므로, 행 변환 비용이 어디로 옮겨졌는지까지 포함해서 비교합니다.
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DB_FILE = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import DateTime, insert, type_coerce  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from app.application.ExamScheduleDto import ExamScheduleResponseDTO  # noqa: E402
+from app.application.ExamScheduleService import ExamScheduleService  # noqa: E402
+from app.infrastructure.Database import Base, create_engine_for  # noqa: E402
+from app.infrastructure.ReservationRepository import ReservationRepository, ExamScheduleORM  # noqa: E402
+
+response_adapter = TypeAdapter(List[dict])
+repository = ReservationRepository()
+service = ExamScheduleService(repository)
+
+# 기존 Repository: 같은 쿼리를 기존 DateTime 타입 처리로 실행 (SQLite에서는 naive 값 반환)
+async def legacy_repository_get_exam_schedules(session: AsyncSession) -> List[dict]:
+    stmt = repository.get_exam_schedules_query()
+    exam_schedule_id, exam_start, exam_end, capacity, confirmed_count = stmt.selected_columns
+    stmt = stmt.with_only_columns(
+        exam_schedule_id,
+        type_coerce(exam_start, DateTime(timezone=True)),
+        type_coerce(exam_end, DateTime(timezone=True)),
+        capacity,
+        confirmed_count
+    )
+    result = await session.execute(stmt)
+    return [
+        {
+            "exam_schedule_id": exam_schedule_id,
+            "exam_start": exam_start,
+            "exam_end": exam_end,
+            "capacity": capacity,
+            "confirmed_count": confirmed_count,
+            "available_capacity": max(capacity - confirmed_count, 0)
+        }
+        for exam_schedule_id, exam_start, exam_end, capacity, confirmed_count in result.all()
+    ]
+
+# 기존 ExamScheduleService.get_exam_schedules (DTO 생성 후 행마다 tzinfo 보정 + isoformat 변환)
+async def legacy_get_exam_schedules(session: AsyncSession) -> List[dict]:
+    schedules = await legacy_repository_get_exam_schedules(session)
+    dto_list = [
+        ExamScheduleResponseDTO(
+            id=s["exam_schedule_id"],
+            exam_start=s["exam_start"],
+            exam_end=s["exam_end"],
+            capacity=s["capacity"],
+            confirmed_count=s["confirmed_count"],
+            available_capacity=s["available_capacity"]
+        ).model_dump()
+        for s in schedules
+    ]
+    for d in dto_list:
+        for key in ["exam_start", "exam_end"]:
+            if isinstance(d.get(key), datetime):
+                dt = d[key]
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                d[key] = dt.isoformat()
+    return dto_list
+
+async def utc_get_exam_schedules(session: AsyncSession) -> List[dict]:
+    return await service.get_exam_schedules(session)
+
+async def seed(session_factory, n: int):
+    base = datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc)
+    async with session_factory() as session:
+        await session.execute(insert(ExamScheduleORM), [
+            {"exam_start": base + timedelta(hours=i), "exam_end": base + timedelta(hours=i + 2), "capacity": 1000}
+            for i in range(n)
+        ])
+        await session.commit()
+
+async def measure(session_factory, get_exam_schedules, rounds: int) -> float:
+    best = None
+    for _ in range(rounds):
+        async with session_factory() as session:
+            start = time.perf_counter()
+            response_adapter.dump_json(await get_exam_schedules(session))
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = 20
+
+    engine = create_engine_for(f"sqlite+aiosqlite:///{DB_FILE}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await seed(session_factory, n)
+
+    # 두 방식의 응답이 같은지 먼저 확인
+    async with session_factory() as session:
+        legacy_json = response_adapter.dump_json(await legacy_get_exam_schedules(session))
+        utc_json = response_adapter.dump_json(await utc_get_exam_schedules(session))
+    same = legacy_json.replace(b"+00:00", b"Z") == utc_json.replace(b"+00:00", b"Z")
+
+    # warm-up 후 교대로 측정하여 캐시 상태 차이를 줄입니다.
+    await measure(session_factory, legacy_get_exam_schedules, 3)
+    await measure(session_factory, utc_get_exam_schedules, 3)
+    legacy = await measure(session_factory, legacy_get_exam_schedules, rounds)
+    utc = await measure(session_factory, utc_get_exam_schedules, rounds)
+    await engine.dispose()
+
+    print(f"{n} schedules per request (best of {rounds}, row load -> JSON)")
+    print(f"[legacy] {legacy * 1e3:8.2f} ms/request ({legacy / n * 1e6:.2f} us/row)")
+    print(f"[utc]    {utc * 1e3:8.2f} ms/request ({utc / n * 1e6:.2f} us/row)")
+    print(f"saved    {(1 - utc / legacy) * 100:.1f}%  (same timestamps: {same})")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+# 요청당 의존성 주입(Repository/Service/User 객체 생성) 비용 벤치마크
+#
+# 실행: python benchmarks/bench_dependency_wiring.py [반복 횟수]
+#
+# - wiring     : 의존성 함수만 호출하여 객체 그래프 생성 비용만 비교
+# - end-to-end : SQLite(aiosqlite) 위에서 GET /exam-schedules, POST /reservations 를 ASGI로 직접 호출
+# legacy 는 요청마다 ReservationRepository/Service/User 를 새로 만들던 기존 방식입니다.
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DB_FILE = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{DB_FILE}")
+
+from fastapi import Depends, Header  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from app.interface import api  # noqa: E402
+from app.interface.RateLimit import RateLimitMiddleware  # noqa: E402
+from app.infrastructure.Database import Base, engine, async_session  # noqa: E402
+from app.infrastructure.ReservationRepository import ReservationRepository  # noqa: E402
+from app.application.ReservationService import ReservationService  # noqa: E402
+from app.application.ExamScheduleService import ExamScheduleService  # noqa: E402
+
+# 기존 방식: 요청마다 객체 그래프를 새로 생성
+async def legacy_get_current_user(x_user_id: str = Header(None), x_user_role: str = Header("customer")):
+    return api.User(user_id=x_user_id, role=x_user_role)
+
+async def legacy_get_reservation_service(session=Depends(api.get_session)):
+    return ReservationService(ReservationRepository())
+
+async def legacy_get_exam_schedule_service(session=Depends(api.get_session)):
+    return ExamScheduleService(ReservationRepository())
+
+LEGACY_OVERRIDES = {
+    api.get_current_user: legacy_get_current_user,
+    api.get_reservation_service: legacy_get_reservation_service,
+    api.get_exam_schedule_service: legacy_get_exam_schedule_service,
+}
+
+async def bench_wiring(n: int):
+    start = time.perf_counter()
+    for _ in range(n):
+        api.User(user_id="user1", role="customer")
+        ReservationService(ReservationRepository())
+        ExamScheduleService(ReservationRepository())
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await api.get_current_user(x_user_id="user1", x_user_role="customer")
+        await api.get_reservation_service()
+        await api.get_exam_schedule_service()
+    singleton = time.perf_counter() - start
+
+    print(f"[wiring]     legacy    {legacy / n * 1e6:8.2f} us/request")
+    print(f"[wiring]     singleton {singleton / n * 1e6:8.2f} us/request")
+
+async def seed() -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        exam_start = datetime.now(timezone.utc) + timedelta(days=30)
+        schedule = await ReservationRepository().create_exam_schedule(
+            session, exam_start=exam_start, exam_end=exam_start + timedelta(hours=2), capacity=1_000_000
+        )
+        return schedule.id
+
+async def run_routes(client: AsyncClient, n: int, exam_schedule_id: int):
+    headers = {"x-user-id": "user1", "x-user-role": "customer"}
+    start = time.perf_counter()
+    for _ in range(n):
+        await client.get("/exam-schedules")
+    get_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await client.post("/reservations", json={"exam_schedule_id": exam_schedule_id, "num_examinees": 1}, headers=headers)
+    post_elapsed = time.perf_counter() - start
+    return get_elapsed / n, post_elapsed / n
+
+async def bench_end_to_end(n: int):
+    engine.echo = False
+    # Rate Limit 에 걸리지 않도록 벤치마크에서는 미들웨어를 제외합니다.
+    api.app.user_middleware = [m for m in api.app.user_middleware if m.cls is not RateLimitMiddleware]
+    exam_schedule_id = await seed()
+
+    transport = ASGITransport(app=api.app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await run_routes(client, 20, exam_schedule_id)  # warm-up
+
+        api.app.dependency_overrides.update(LEGACY_OVERRIDES)
+        legacy = await run_routes(client, n, exam_schedule_id)
+        api.app.dependency_overrides.clear()
+        singleton = await run_routes(client, n, exam_schedule_id)
+
+    for name, (get_t, post_t) in (("legacy", legacy), ("singleton", singleton)):
+        print(f"[end-to-end] {name:9s} GET /exam-schedules {get_t * 1e3:7.3f} ms  POST /reservations {post_t * 1e3:7.3f} ms")
+    await engine.dispose()
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    await bench_wiring(n * 100)
+    await bench_end_to_end(n)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timedelta, timezone
 from app.application.ReservationDto import (
     ReservationCreateDTO,
@@ -14,30 +14,41 @@ def mock_repository():
     repo = AsyncMock()
     return repo
 
+@pytest.fixture
+def mock_session():
+    return AsyncMock()
+
 @pytest.fixture
 def admin_reservation_service(mock_repository):
     return AdminReservationService(repository=mock_repository)
 
-# 전체 예약 조회 테스트
+# 전체 예약 조회 테스트 (시험 일정 시각은 JOIN 결과 사용)
 @pytest.mark.asyncio
-async def test_get_all_reservations(admin_reservation_service, mock_repository):
+async def test_get_all_reservations(admin_reservation_service, mock_repository, mock_session):
+    exam_start = datetime.now(timezone.utc)
     reservations = [
-        ReservationResponseDTO(id=1, user_id="user1", exam_schedule_id=1, exam_start=datetime.now(timezone.utc),
-                               exam_end=datetime.now(timezone.utc) + timedelta(hours=2), num_examinees=100,
-                               status=ReservationStatus.pending, created_at=datetime.now(timezone.utc),
+        ReservationResponseDTO(id=1, user_id="user1", exam_schedule_id=1, exam_start=None, exam_end=None,
+                               num_examinees=100, status=ReservationStatus.pending, created_at=datetime.now(timezone.utc),
                                updated_at=datetime.now(timezone.utc)),
     ]
-    mock_repository.list_all.return_value = reservations
 
-    result = await admin_reservation_service.get_all_reservations()
+    async def stream_all_with_schedule(session):
+        for r in reservations:
+            yield r, exam_start, exam_start + timedelta(hours=2)
+
+    mock_repository.stream_all_with_schedule = MagicMock(side_effect=stream_all_with_schedule)
+
+    result = [dto async for dto in admin_reservation_service.stream_all_reservations(mock_session)]
     
     assert len(result) == 1
     assert result[0]["id"] == 1
-    mock_repository.list_all.assert_called_once()
+    assert result[0]["exam_start"] == exam_start
+    mock_repository.stream_all_with_schedule.assert_called_once_with(mock_session)
+    mock_repository.get_exam_schedule_by_id.assert_not_called()
 
 # 예약 확정 테스트
 @pytest.mark.asyncio
-async def test_confirm_reservation(admin_reservation_service, mock_repository):
+async def test_confirm_reservation(admin_reservation_service, mock_repository, mock_session):
     reservation = Reservation(id=1, user_id="user1", exam_schedule_id=1, exam_start=datetime.now(timezone.utc),
                               exam_end=datetime.now(timezone.utc) + timedelta(hours=2), num_examinees=100,
                               status=ReservationStatus.pending, created_at=datetime.now(timezone.utc),
@@ -45,16 +56,16 @@ async def test_confirm_reservation(admin_reservation_service, mock_repository):
     mock_repository.get_by_id.return_value = reservation
     mock_repository.get_exam_schedule_by_id.return_value = AsyncMock(capacity=500, confirmed_count=100)
     mock_repository.get_confirmed_sum.return_value = 100
-    mock_repository.update.return_value = reservation
+    mock_repository.update_status.return_value = reservation.model_copy(update={"status": ReservationStatus.confirmed})
     
-    result = await admin_reservation_service.confirm_reservation(1)
+    result = await admin_reservation_service.confirm_reservation(mock_session, 1)
     
     assert result["status"] == ReservationStatus.confirmed.value
-    mock_repository.update.assert_called_once()
+    mock_repository.update_status.assert_called_once_with(mock_session, reservation, ReservationStatus.confirmed)
 
 # 예약 수정 테스트
 @pytest.mark.asyncio
-async def test_update_reservation(admin_reservation_service, mock_repository):
+async def test_update_reservation(admin_reservation_service, mock_repository, mock_session):
     reservation = Reservation(id=1, user_id="user1", exam_schedule_id=1, exam_start=datetime.now(timezone.utc),
                               exam_end=datetime.now(timezone.utc) + timedelta(hours=2), num_examinees=100,
                               status=ReservationStatus.pending, created_at=datetime.now(timezone.utc),
@@ -62,23 +73,59 @@ async def test_update_reservation(admin_reservation_service, mock_repository):
     mock_repository.get_by_id.return_value = reservation
     mock_repository.get_exam_schedule_by_id.return_value = AsyncMock(capacity=500, confirmed_count=100)
     mock_repository.get_confirmed_sum.return_value = 100
-    mock_repository.update.return_value = reservation
+    mock_repository.update_num_examinees.return_value = reservation.model_copy(update={"num_examinees": 150})
     
     dto = ReservationUpdateDTO(num_examinees=150)
-    result = await admin_reservation_service.update_reservation(1, dto)
+    result = await admin_reservation_service.update_reservation(mock_session, 1, dto)
     
     assert result["num_examinees"] == 150
-    mock_repository.update.assert_called_once()
+    mock_repository.update_num_examinees.assert_called_once_with(mock_session, reservation, 150)
 
 # 예약 삭제 테스트
 @pytest.mark.asyncio
-async def test_delete_reservation(admin_reservation_service, mock_repository):
+async def test_delete_reservation(admin_reservation_service, mock_repository, mock_session):
     reservation = Reservation(id=1, user_id="user1", exam_schedule_id=1, exam_start=datetime.now(timezone.utc),
                               exam_end=datetime.now(timezone.utc) + timedelta(hours=2), num_examinees=100,
                               status=ReservationStatus.pending, created_at=datetime.now(timezone.utc),
                               updated_at=datetime.now(timezone.utc))
     mock_repository.get_by_id.return_value = reservation
     
-    await admin_reservation_service.delete_reservation(1)
+    await admin_reservation_service.delete_reservation(mock_session, 1)
     
     mock_repository.delete.assert_called_once()
+
+# 종료된 시험 일정 Archive 테스트
+@pytest.mark.asyncio
+async def test_archive_completed_schedules(admin_reservation_service, mock_repository, mock_session):
+    mock_repository.archive_completed_schedules.return_value = 3
+    cutoff = datetime.now(timezone.utc)
+
+    result = await admin_reservation_service.archive_completed_schedules(mock_session, before=cutoff, batch_size=50)
+
+    assert result["archived_exam_schedules"] == 3
+    mock_repository.archive_completed_schedules.assert_called_once_with(mock_session, cutoff, batch_size=50)
+
+# 과거(Archive) 예약 조회 테스트
+@pytest.mark.asyncio
+async def test_get_archived_reservations(admin_reservation_service, mock_repository, mock_session):
+    exam_start = datetime.now(timezone.utc) - timedelta(days=400)
+    exam_end = exam_start + timedelta(hours=2)
+    archived = ReservationResponseDTO(id=7, user_id="user1", exam_schedule_id=1, num_examinees=10,
+                                      status=ReservationStatus.confirmed, created_at=exam_start - timedelta(days=10),
+                                      updated_at=exam_start - timedelta(days=5))
+    mock_repository.list_archived.return_value = [(archived, exam_start, exam_end)]
+
+    result = await admin_reservation_service.get_archived_reservations(mock_session, after_id=5, limit=10)
+
+    assert len(result) == 1
+    assert result[0]["id"] == 7
+    assert result[0]["exam_start"] == exam_start
+    mock_repository.list_archived.assert_called_once_with(
+        mock_session, after_id=5, limit=10, exam_schedule_id=None, user_id=None
+    )
+
+# 과거(Archive) 예약 조회 - 페이지 크기 제한
+@pytest.mark.asyncio
+async def test_get_archived_reservations_invalid_limit(admin_reservation_service, mock_session):
+    with pytest.raises(Exception, match="Limit must be between 1 and 1000"):
+        await admin_reservation_service.get_archived_reservations(mock_session, limit=0)
@@ -0,0 +1,206 @@
+import asyncio
+import gzip
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from pydantic_core import to_json
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.infrastructure.Database import Base, create_engine_for
+from app.infrastructure.ReservationRepository import ReservationORM, ExamScheduleORM
+from app.interface import api
+from app.interface.Compression import CompressionMiddleware, parse_accept_encoding
+
+NUM_API_SCHEDULES = 50
+NUM_API_RESERVATIONS = 2000
+
+LARGE_BODY = json.dumps([{"id": i, "status": "confirmed", "num_examinees": i % 7} for i in range(500)]).encode()
+
+def json_app(body: bytes, chunks: int = 1, headers=None):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers or [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        size = len(body) // chunks + 1
+        parts = [body[i:i + size] for i in range(0, len(body), size)] or [b""]
+        for index, part in enumerate(parts):
+            await send({"type": "http.response.body", "body": part, "more_body": index < len(parts) - 1})
+    return app
+
+async def call(app, accept_encoding="gzip"):
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    headers = dict(sent[0]["headers"])
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return headers, body, sent
+
+# 테스트: 임계값 이상의 응답은 gzip 으로 압축되고 Content-Length 가 갱신됨
+@pytest.mark.asyncio
+async def test_compresses_large_response():
+    headers, body, _ = await call(CompressionMiddleware(json_app(LARGE_BODY), encodings=["gzip"]))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert int(headers[b"content-length"]) == len(body) < len(LARGE_BODY)
+    assert gzip.decompress(body) == LARGE_BODY
+
+# 테스트: 작은 응답, Accept-Encoding 미지원, 이미 인코딩된 응답은 그대로 전달
+@pytest.mark.asyncio
+async def test_passthrough_cases():
+    small = b'{"detail":"ok"}'
+    headers, body, _ = await call(CompressionMiddleware(json_app(small), encodings=["gzip"]))
+    assert b"content-encoding" not in headers and body == small
+
+    headers, body, _ = await call(CompressionMiddleware(json_app(LARGE_BODY), encodings=["gzip"]), accept_encoding="identity")
+    assert b"content-encoding" not in headers and body == LARGE_BODY
+
+    encoded = [(b"content-type", b"application/json"), (b"content-encoding", b"br")]
+    headers, body, _ = await call(CompressionMiddleware(json_app(LARGE_BODY, headers=encoded), encodings=["gzip"]))
+    assert headers[b"content-encoding"] == b"br" and body == LARGE_BODY
+
+# 테스트: 스트리밍 응답은 조각마다 압축해서 바로 전달 (전체 본문을 모으지 않음)
+@pytest.mark.asyncio
+async def test_streams_chunked_response():
+    headers, body, sent = await call(CompressionMiddleware(json_app(LARGE_BODY, chunks=5), encodings=["gzip"]))
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert len(sent) == 1 + 5
+    assert all(m["body"] for m in sent[1:-1])
+    assert gzip.decompress(body) == LARGE_BODY
+
+# 테스트: minimum_size 보다 작은 스트리밍 응답은 끝까지 모은 뒤 압축하지 않고 그대로 전달
+@pytest.mark.asyncio
+async def test_small_streamed_response_not_compressed():
+    small = b'[{"id":1},{"id":2}]'
+    streamed = [(b"content-type", b"application/json")]
+    headers, body, sent = await call(CompressionMiddleware(json_app(small, chunks=3, headers=streamed), encodings=["gzip"]))
+
+    assert b"content-encoding" not in headers
+    assert body == small
+    assert len(sent) == 2 and not sent[1].get("more_body", False)
+
+# 테스트: 스트리밍 응답은 minimum_size 까지 모인 뒤 압축을 시작
+@pytest.mark.asyncio
+async def test_streamed_response_compressed_after_minimum_size():
+    streamed = [(b"content-type", b"application/json")]
+    middleware = CompressionMiddleware(json_app(LARGE_BODY, chunks=50, headers=streamed), minimum_size=len(LARGE_BODY) // 2, encodings=["gzip"])
+    headers, body, sent = await call(middleware)
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert len(sent) < 1 + 50
+    assert gzip.decompress(body) == LARGE_BODY
+
+# 테스트: Accept-Encoding q 값 파싱
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, zstd;q=0") == {"gzip": 0.5, "br": 1.0, "zstd": 0.0}
+
+# 테스트: 서버 선호 순서와 클라이언트 q=0 을 반영해 인코딩 선택
+def test_select_encoding():
+    middleware = CompressionMiddleware(None, encodings=["gzip"])
+
+    assert middleware._select_encoding({"headers": [(b"accept-encoding", b"deflate, gzip")]}) == "gzip"
+    assert middleware._select_encoding({"headers": [(b"accept-encoding", b"gzip;q=0")]}) is None
+    assert middleware._select_encoding({"headers": [(b"accept-encoding", b"*")]}) == "gzip"
+    assert middleware._select_encoding({"headers": []}) is None
+
+@pytest.fixture
+async def api_session_factory(tmp_path):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'api.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    exam_start = datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc)
+    async with session_factory() as session:
+        await session.execute(insert(ExamScheduleORM), [
+            {"exam_start": exam_start + timedelta(days=i), "exam_end": exam_start + timedelta(days=i, hours=2), "capacity": 1000}
+            for i in range(NUM_API_SCHEDULES)
+        ])
+        await session.execute(insert(ReservationORM), [
+            {"user_id": f"user{i}", "exam_schedule_id": i % NUM_API_SCHEDULES + 1, "num_examinees": 1,
+             "status": "confirmed" if i % 3 == 0 else "pending"}
+            for i in range(NUM_API_RESERVATIONS)
+        ])
+        await session.commit()
+
+    async def get_session_factory():
+        return session_factory
+
+    api.app.dependency_overrides[api.get_session_factory] = get_session_factory
+    yield session_factory
+    api.app.dependency_overrides.clear()
+    await engine.dispose()
+
+async def call_api(path: str):
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "server": ("test", 80), "client": ("10.0.0.1", 12345),
+        "headers": [(b"accept-encoding", b"gzip"), (b"x-user-id", b"admin"), (b"x-user-role", b"admin")],
+    }
+    sent = []
+    requested = asyncio.Event()
+
+    # 요청 본문은 한 번만 전달하고, 이후에는 연결이 끊기지 않은 상태로 대기
+    async def receive():
+        if requested.is_set():
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await api.app(scope, receive, send)
+    return dict(sent[0]["headers"]), sent[1:]
+
+# 테스트: 큰 목록 API는 JSON 배열을 여러 조각으로 스트리밍하고, 압축도 조각마다 수행
+@pytest.mark.asyncio
+async def test_list_endpoints_stream_compressed_chunks(api_session_factory):
+    headers, messages = await call_api("/admin/reservations")
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert len([m for m in messages if m.get("body")]) > 2
+    reservations = json.loads(gzip.decompress(b"".join(m.get("body", b"") for m in messages)))
+    assert [r["id"] for r in reservations] == list(range(1, NUM_API_RESERVATIONS + 1))
+    assert reservations[0]["exam_start"] == "2030-01-01T09:00:00Z"
+    assert reservations[0]["status"] == "confirmed"
+
+    headers, messages = await call_api("/exam-schedules")
+    schedules = json.loads(gzip.decompress(b"".join(m.get("body", b"") for m in messages)))
+    async with api_session_factory() as session:
+        expected = await api.exam_schedule_service.get_exam_schedules(session)
+    assert schedules == json.loads(to_json(expected))
+
+# 테스트: 비어 있는 목록처럼 작은 스트리밍 응답은 압축하지 않음
+@pytest.mark.asyncio
+async def test_small_streamed_list_not_compressed(tmp_path):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_session_factory():
+        return session_factory
+
+    api.app.dependency_overrides[api.get_session_factory] = get_session_factory
+    try:
+        headers, messages = await call_api("/exam-schedules")
+    finally:
+        api.app.dependency_overrides.clear()
+        await engine.dispose()
+
+    assert b"content-encoding" not in headers
+    assert b"".join(m.get("body", b"") for m in messages) == b"[]"
@@ -0,0 +1,100 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import (
+    OperationalError,
+    InterfaceError,
+    DisconnectionError,
+    DataError,
+    ProgrammingError,
+    InvalidRequestError,
+    NoResultFound,
+    TimeoutError as PoolTimeoutError
+)
+from app.domain.Exception import (
+    ReservationException,
+    NotFoundException,
+    CapacityExceededException,
+    PermissionDeniedException
+)
+from app.interface.ErrorHandler import register_exception_handlers, error_metrics
+
+ERRORS = {
+    "not-found": NotFoundException("Reservation not found"),
+    "capacity": CapacityExceededException("Exceeds available capacity for this exam schedule"),
+    "forbidden": PermissionDeniedException("Not authorized to update this reservation"),
+    "generic": ReservationException("Something went wrong"),
+    "db-down": OperationalError("SELECT 1", {}, Exception("connection refused")),
+    "pool-timeout": PoolTimeoutError("QueuePool limit reached"),
+    "interface": InterfaceError("SELECT 1", {}, Exception("connection closed")),
+    "disconnected": DisconnectionError("connection invalidated"),
+    "bad-data": DataError("INSERT", {}, Exception("value out of range")),
+    "bad-sql": ProgrammingError("SELEC 1", {}, Exception("syntax error")),
+    "bad-orm": InvalidRequestError("object is not bound to a session"),
+    "no-result": NoResultFound("No row was found when one was required"),
+}
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/raise/{name}")
+    async def raise_error(name: str):
+        raise ERRORS[name]
+
+    error_metrics.reset()
+    return TestClient(app)
+
+# 테스트: 도메인 예외는 종류별 상태 코드와 오류 코드로 변환
+@pytest.mark.parametrize("name, status_code, code", [
+    ("not-found", 404, "not_found"),
+    ("capacity", 409, "capacity_exceeded"),
+    ("forbidden", 403, "permission_denied"),
+    ("generic", 400, "reservation_error"),
+])
+def test_domain_exception_mapping(client, name, status_code, code):
+    response = client.get(f"/raise/{name}")
+
+    assert response.status_code == status_code
+    assert response.json()["code"] == code
+    assert "Retry-After" not in response.headers
+
+# 테스트: DB 연결 장애와 커넥션 풀 타임아웃은 503 + Retry-After
+@pytest.mark.parametrize("name", ["db-down", "pool-timeout", "interface", "disconnected"])
+def test_infrastructure_exception_returns_503(client, name):
+    response = client.get(f"/raise/{name}")
+
+    assert response.status_code == 503
+    assert response.json()["code"] == "database_unavailable"
+    assert response.headers["Retry-After"] == "5"
+
+# 테스트: 잘못된 입력 값(DataError)은 재시도 없이 400
+def test_data_error_returns_400(client):
+    response = client.get("/raise/bad-data")
+
+    assert response.status_code == 400
+    assert response.json()["code"] == "invalid_data"
+    assert "Retry-After" not in response.headers
+
+# 테스트: 일시적 장애가 아닌 DB 오류는 503이 아닌 500
+@pytest.mark.parametrize("name", ["bad-sql", "bad-orm", "no-result"])
+def test_other_database_errors_return_500(client, name):
+    response = client.get(f"/raise/{name}")
+
+    assert response.status_code == 500
+    assert response.json()["code"] == "database_error"
+    assert "Retry-After" not in response.headers
+
+# 테스트: 도메인 오류와 인프라 장애를 구분해서 집계
+def test_error_metrics_by_category(client):
+    client.get("/raise/not-found")
+    client.get("/raise/not-found")
+    client.get("/raise/db-down")
+    client.get("/raise/bad-sql")
+
+    assert error_metrics.snapshot() == {
+        "domain": {"not_found": 2},
+        "infrastructure": {"database_unavailable": 1},
+        "internal": {"database_error": 1},
+    }
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import select
+from app.application.AdminReservationService import AdminReservationService
+from app.application.ReservationDto import ReservationUpdateDTO
+from app.domain.Reservation import ReservationStatus
+from app.infrastructure.ReservationRepository import ReservationEventORM
+from app.infrastructure.EventReplay import replay_confirmed_counts, rebuild_confirmed_counts
+from tests.ReservationRepositoryTest import create_schedule, create_reservation
+
+# 테스트: 이벤트 재생 - 마지막 상태 기준으로 확정 인원 합산, 삭제된 예약 제외
+def test_replay_confirmed_counts():
+    events = [
+        (1, 10, "created", "pending", 5),
+        (2, 10, "created", "pending", 3),
+        (3, 20, "created", "pending", 7),
+        (1, 10, "confirmed", "confirmed", 5),
+        (2, 10, "updated", "pending", 4),
+        (2, 10, "confirmed", "confirmed", 4),
+        (3, 20, "confirmed", "confirmed", 7),
+        (3, 20, "deleted", "confirmed", 7),
+    ]
+
+    assert replay_confirmed_counts(events) == {10: 9}
+
+# 테스트: 예약 생성/확정/수정/삭제가 이벤트로 기록되고, 재생 결과가 현재 집계와 일치
+@pytest.mark.asyncio
+async def test_rebuild_confirmed_counts_matches_current_state(sqlite_session, repository):
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    first = await create_reservation(repository, sqlite_session, schedule.id, 5)
+    second = await create_reservation(repository, sqlite_session, schedule.id, 3)
+    third = await create_reservation(repository, sqlite_session, schedule.id, 2)
+
+    await repository.update_status(sqlite_session, first, ReservationStatus.confirmed)
+    await repository.update_num_examinees(sqlite_session, second, 4)
+    await repository.update_status(sqlite_session, second, ReservationStatus.confirmed)
+    await repository.delete(sqlite_session, third)
+
+    events = [row async for row in repository.stream_events(sqlite_session)]
+    assert [(e.reservation_id, e.event_type) for e in events] == [
+        (first.id, "created"), (second.id, "created"), (third.id, "created"),
+        (first.id, "confirmed"), (second.id, "updated"), (second.id, "confirmed"), (third.id, "deleted"),
+    ]
+    assert await rebuild_confirmed_counts(sqlite_session, repository) == {
+        schedule.id: await repository.get_confirmed_sum(sqlite_session, schedule.id)
+    }
+
+# 테스트: 서비스 흐름(autoflush 를 일으키는 get_confirmed_sum 조회 포함)을 거쳐도 이벤트와 이전 값이 기록됨
+@pytest.mark.asyncio
+async def test_service_updates_record_events_with_previous_values(sqlite_session, repository):
+    service = AdminReservationService(repository)
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    reservation = await create_reservation(repository, sqlite_session, schedule.id, 5)
+
+    await service.update_reservation(sqlite_session, reservation.id, ReservationUpdateDTO(num_examinees=6))
+    await service.confirm_reservation(sqlite_session, reservation.id)
+
+    result = await sqlite_session.execute(
+        select(
+            ReservationEventORM.event_type,
+            ReservationEventORM.status,
+            ReservationEventORM.num_examinees,
+            ReservationEventORM.prev_status,
+            ReservationEventORM.prev_num_examinees
+        ).order_by(ReservationEventORM.id)
+    )
+    assert [tuple(row) for row in result.all()] == [
+        ("created", "pending", 5, None, None),
+        ("updated", "pending", 6, "pending", 5),
+        ("confirmed", "confirmed", 6, "pending", 6),
+    ]
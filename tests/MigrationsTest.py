@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import inspect, text
+from app.infrastructure.Database import create_engine_for
+from app.infrastructure.Migrations import INDEXES, migrate_indexes
+from app.infrastructure.ReservationRepository import ReservationORM
+
+# PostgreSQL 연결 대신 실행된 SQL 만 기록하는 연결
+class RecordingPostgresConnection:
+    class dialect:
+        name = "postgresql"
+
+    class _Result:
+        def scalars(self):
+            return self
+
+        def all(self):
+            return ["ix_reservations_schedule_status_examinees"]
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return self._Result()
+
+def index_names(sync_conn, table):
+    return {index["name"] for index in inspect(sync_conn).get_indexes(table)}
+
+# 테스트: 기존 DB(이전 스키마의 reservations 테이블)에 Covering Index 를 만들고 대체된 인덱스를 삭제
+@pytest.mark.asyncio
+async def test_migrate_indexes_on_existing_table():
+    engine = create_engine_for("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE reservations (id INTEGER PRIMARY KEY, user_id VARCHAR, exam_schedule_id INTEGER NOT NULL, "
+            "num_examinees INTEGER NOT NULL, status VARCHAR NOT NULL)"
+        ))
+        await conn.execute(text("CREATE INDEX ix_reservations_exam_schedule_id ON reservations (exam_schedule_id)"))
+
+        await migrate_indexes(conn)
+        # 두 번 실행해도 안전
+        await migrate_indexes(conn)
+
+        names = await conn.run_sync(index_names, "reservations")
+    await engine.dispose()
+
+    assert "ix_reservations_schedule_status_examinees" in names
+    assert "ix_reservations_exam_schedule_id" not in names
+
+# 테스트: 마이그레이션 인덱스 정의가 ORM 정의와 같음
+def test_migration_indexes_match_orm():
+    orm_indexes = {index.name: [c.name for c in index.columns] for index in ReservationORM.__table__.indexes}
+    for name, (table, columns) in INDEXES.items():
+        assert table == ReservationORM.__tablename__
+        assert orm_indexes[name] == columns
+
+# 테스트: PostgreSQL 은 트랜잭션 잠금 없이 CONCURRENTLY 로 인덱스를 만들고, 실패로 남은 INVALID 인덱스는 먼저 삭제
+@pytest.mark.asyncio
+async def test_migrate_indexes_concurrently_on_postgresql():
+    conn = RecordingPostgresConnection()
+
+    await migrate_indexes(conn)
+
+    assert conn.statements[0] == "SELECT pg_advisory_lock(:key)"
+    assert conn.statements[-1] == "SELECT pg_advisory_unlock(:key)"
+    assert not any("pg_advisory_xact_lock" in s for s in conn.statements)
+    ddl = [s for s in conn.statements if "INDEX" in s and not s.startswith("SELECT")]
+    assert ddl == [
+        'DROP INDEX CONCURRENTLY IF EXISTS "ix_reservations_schedule_status_examinees"',
+        'CREATE INDEX CONCURRENTLY IF NOT EXISTS "ix_reservations_schedule_status_examinees" '
+        'ON "reservations" ("exam_schedule_id", "status", "num_examinees")',
+        'DROP INDEX CONCURRENTLY IF EXISTS "ix_reservations_exam_schedule_id"',
+    ]
@@ -0,0 +1,88 @@
+# 실행 계획 회귀 테스트
+# 시드 데이터를 넣은 SQLite DB에서 ReservationRepository의 Hot 쿼리를 EXPLAIN QUERY PLAN 으로 확인합니다.
+# - 인덱스를 사용하는지, 큰 테이블을 전체 스캔하지 않는지 검사합니다.
+# - 실행 계획을 tests/plan_snapshots/ 에 저장해 두고, 스키마/ORM 변경으로 계획이 달라지면 실패합니다.
+#   의도한 변경이라면 UPDATE_PLAN_SNAPSHOTS=1 로 실행하여 스냅샷을 갱신합니다.
+#   스냅샷 파일이 없어도 실패하므로, 새 Hot 쿼리를 추가할 때도 UPDATE_PLAN_SNAPSHOTS=1 로 한 번 생성해야 합니다.
+import os
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import insert, text
+from app.infrastructure.ReservationRepository import ReservationRepository, ReservationORM, ExamScheduleORM
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "plan_snapshots", "sqlite")
+NUM_EXAM_SCHEDULES = 200
+NUM_RESERVATIONS = 10_000
+# 이 행 수보다 큰 테이블은 전체 스캔(SCAN)하면 안 됩니다.
+SEQ_SCAN_ROW_THRESHOLD = 1_000
+
+repository = ReservationRepository()
+
+# (스냅샷 이름, 쿼리, 반드시 사용해야 하는 인덱스)
+HOT_QUERIES = [
+    ("get_confirmed_sum", repository.get_confirmed_sum_query(5),
+     "COVERING INDEX ix_reservations_schedule_status_examinees"),
+    ("get_confirmed_sum_exclude", repository.get_confirmed_sum_query(5, exclude_id=42),
+     "COVERING INDEX ix_reservations_schedule_status_examinees"),
+    ("get_exam_schedules", repository.get_exam_schedules_query(),
+     "COVERING INDEX ix_reservations_schedule_status_examinees"),
+    ("list_by_user", repository.list_by_user_query("user7"),
+     "INDEX ix_reservations_user_id"),
+    ("get_by_id", repository.get_by_id_query(42),
+     "INTEGER PRIMARY KEY"),
+]
+
+TABLE_ROWS = {
+    ExamScheduleORM.__tablename__: NUM_EXAM_SCHEDULES,
+    ReservationORM.__tablename__: NUM_RESERVATIONS,
+}
+
+@pytest.fixture
+async def seeded_session(sqlite_session):
+    exam_start = datetime.now(timezone.utc) + timedelta(days=10)
+    await sqlite_session.execute(insert(ExamScheduleORM), [
+        {"exam_start": exam_start + timedelta(days=i), "exam_end": exam_start + timedelta(days=i, hours=2), "capacity": 1000}
+        for i in range(NUM_EXAM_SCHEDULES)
+    ])
+    await sqlite_session.execute(insert(ReservationORM), [
+        {"user_id": f"user{i % 5000}", "exam_schedule_id": i % NUM_EXAM_SCHEDULES + 1, "num_examinees": 1,
+         "status": "confirmed" if i % 3 == 0 else "pending"}
+        for i in range(NUM_RESERVATIONS)
+    ])
+    # 플래너가 실제 데이터 분포를 보고 계획을 세우도록 통계 수집
+    await sqlite_session.execute(text("ANALYZE"))
+    await sqlite_session.commit()
+    return sqlite_session
+
+async def explain(session, stmt) -> list:
+    bind = session.get_bind()
+    sql = str(stmt.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True}))
+    result = await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return [row[3] for row in result.all()]
+
+def check_snapshot(name: str, plan: list):
+    path = os.path.join(SNAPSHOT_DIR, f"{name}.txt")
+    content = "\n".join(plan) + "\n"
+    if os.getenv("UPDATE_PLAN_SNAPSHOTS"):
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return
+    # 스냅샷이 삭제/이름 변경된 경우 조용히 새로 만들지 않고 실패시킵니다.
+    assert os.path.exists(path), f"Missing query plan snapshot {path} (run with UPDATE_PLAN_SNAPSHOTS=1 to create it)"
+    with open(path) as f:
+        expected = f.read()
+    assert content == expected, f"Query plan for {name} changed:\n--- expected\n{expected}--- actual\n{content}"
+
+# 테스트: Hot 쿼리는 인덱스를 사용하고 큰 테이블을 전체 스캔하지 않음
+@pytest.mark.parametrize("name, stmt, required_index", HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+@pytest.mark.asyncio
+async def test_hot_query_plan(seeded_session, name, stmt, required_index):
+    plan = await explain(seeded_session, stmt)
+
+    assert any(required_index in step for step in plan), f"{name} does not use {required_index}: {plan}"
+    for step in plan:
+        if step.startswith("SCAN "):
+            table = step.split()[1]
+            assert TABLE_ROWS.get(table, 0) <= SEQ_SCAN_ROW_THRESHOLD, f"{name} scans {table}: {plan}"
+    check_snapshot(name, plan)
@@ -0,0 +1,143 @@
+import pytest
+from app.interface.RateLimit import (
+    DEFAULT_RULES,
+    InMemoryTokenBucketBackend,
+    RateLimitMiddleware,
+    RateLimitRule,
+    TokenBucketBackend
+)
+from app.interface.ErrorHandler import error_metrics
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def backend(clock):
+    return InMemoryTokenBucketBackend(clock=clock)
+
+class FailingBackend(TokenBucketBackend):
+    async def consume(self, key: str, rate: float, burst: int) -> float:
+        raise ConnectionError("redis unavailable")
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+
+def make_scope(method="POST", path="/reservations", user_id="user1", ip="10.0.0.1"):
+    headers = [(b"x-user-id", user_id.encode())] if user_id else []
+    return {"type": "http", "method": method, "path": path, "headers": headers, "client": (ip, 12345)}
+
+async def call(middleware, scope):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent
+
+# 테스트: burst 만큼 허용 후 거절, 시간이 지나면 토큰 재충전
+@pytest.mark.asyncio
+async def test_token_bucket_burst_and_refill(backend, clock):
+    for _ in range(3):
+        assert await backend.consume("k", rate=1.0, burst=3) == 0.0
+
+    wait = await backend.consume("k", rate=1.0, burst=3)
+    assert wait == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert await backend.consume("k", rate=1.0, burst=3) == 0.0
+
+# 테스트: 키 개수 제한을 넘으면 가장 오래 사용되지 않은 버킷부터 제거 (LRU)
+@pytest.mark.asyncio
+async def test_token_bucket_evicts_least_recently_used(clock):
+    backend = InMemoryTokenBucketBackend(max_keys=2, clock=clock)
+    await backend.consume("a", rate=1.0, burst=1)
+    await backend.consume("b", rate=1.0, burst=1)
+    # 최근에 사용한 "a" 는 남고 "b" 가 제거됨
+    await backend.consume("a", rate=1.0, burst=1)
+    await backend.consume("c", rate=1.0, burst=1)
+
+    assert list(backend._buckets) == ["a", "c"]
+    # 남아 있는 "a" 는 제한 상태가 유지됨
+    assert await backend.consume("a", rate=1.0, burst=1) > 0
+
+# 테스트: 제한 초과 시 애플리케이션(및 DB 세션)까지 도달하지 않고 429 반환
+@pytest.mark.asyncio
+async def test_middleware_rejects_before_app(backend):
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    middleware = RateLimitMiddleware(app, backend=backend, rules=[RateLimitRule("POST", "/reservations", rate=1.0, burst=2)])
+
+    assert (await call(middleware, make_scope()))[0]["status"] == 200
+    assert (await call(middleware, make_scope()))[0]["status"] == 200
+    rejected = await call(middleware, make_scope())
+
+    assert rejected[0]["status"] == 429
+    assert (b"retry-after", b"1") in rejected[0]["headers"]
+    assert len(calls) == 2
+
+    # 다른 사용자는 별도 버킷을 사용
+    assert (await call(middleware, make_scope(user_id="user2")))[0]["status"] == 200
+
+# 테스트: 규칙에 해당하지 않는 요청은 제한하지 않음
+@pytest.mark.asyncio
+async def test_middleware_skips_unmatched_routes(backend):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    middleware = RateLimitMiddleware(app, backend=backend, rules=[RateLimitRule("POST", "/reservations", rate=1.0, burst=1)])
+
+    for _ in range(5):
+        assert (await call(middleware, make_scope(method="GET", path="/exam-schedules")))[0]["status"] == 200
+
+# 테스트: 규칙 경로는 세그먼트 단위로 일치 ("/reservationsX" 는 "/reservations" 규칙에 해당하지 않음)
+@pytest.mark.parametrize("method, path, expected", [
+    ("POST", "/reservations", "/reservations"),
+    ("PUT", "/reservations/3", "/reservations"),
+    ("POST", "/reservations/3/confirm", "/reservations/{reservation_id}/confirm"),
+    ("POST", "/reservationsX", "/"),
+    ("GET", "/exam-schedules", "/exam-schedules"),
+])
+def test_default_rules_match_on_path_segments(method, path, expected):
+    middleware = RateLimitMiddleware(ok_app)
+
+    assert middleware._match(method, path).path == expected
+
+# 테스트: 관리자 예약 확정은 예약 생성(POST /reservations) 제한을 함께 쓰지 않음
+@pytest.mark.asyncio
+async def test_confirm_uses_separate_bucket(backend):
+    middleware = RateLimitMiddleware(ok_app, backend=backend)
+
+    for _ in range(5):
+        assert (await call(middleware, make_scope()))[0]["status"] == 200
+    assert (await call(middleware, make_scope()))[0]["status"] == 429
+
+    for i in range(10):
+        assert (await call(middleware, make_scope(path=f"/reservations/{i}/confirm")))[0]["status"] == 200
+
+# 테스트: 저장소 장애 시 500 대신 요청을 통과시키고(fail open) 인프라 장애로 집계
+@pytest.mark.asyncio
+async def test_backend_failure_fails_open():
+    error_metrics.reset()
+    middleware = RateLimitMiddleware(ok_app, backend=FailingBackend())
+
+    for _ in range(3):
+        assert (await call(middleware, make_scope()))[0]["status"] == 200
+
+    assert error_metrics.snapshot() == {"infrastructure": {"rate_limit_unavailable": 3}}
@@ -0,0 +1,121 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import text
+from app.infrastructure.Database import create_engine_for
+from app.domain.Reservation import Reservation, ReservationStatus
+
+async def create_schedule(repository, session, days: int, capacity: int = 100):
+    exam_start = datetime.now(timezone.utc) + timedelta(days=days)
+    return await repository.create_exam_schedule(session, exam_start=exam_start, exam_end=exam_start + timedelta(hours=2), capacity=capacity)
+
+async def create_reservation(repository, session, schedule_id: int, num_examinees: int, status=ReservationStatus.pending, user_id="user1"):
+    return await repository.create(session, Reservation(user_id=user_id, exam_schedule_id=schedule_id, num_examinees=num_examinees, status=status))
+
+# 테스트: SQLite 프로필 PRAGMA 적용 (메모리 DB는 WAL 대신 memory 저널 사용)
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_applied(sqlite_session):
+    assert (await sqlite_session.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+    assert (await sqlite_session.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+    assert (await sqlite_session.execute(text("PRAGMA journal_mode"))).scalar() == "memory"
+
+# 테스트: 파일 DB는 WAL 저널 모드로 열림
+@pytest.mark.asyncio
+async def test_sqlite_file_database_uses_wal(tmp_path):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'reservation.db'}")
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+    await engine.dispose()
+
+# 테스트: 확정된 예약 인원만 합산, exclude_id 제외
+@pytest.mark.asyncio
+async def test_get_confirmed_sum(sqlite_session, repository):
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    confirmed = await create_reservation(repository, sqlite_session, schedule.id, 30, ReservationStatus.confirmed)
+    await create_reservation(repository, sqlite_session, schedule.id, 20, ReservationStatus.confirmed)
+    await create_reservation(repository, sqlite_session, schedule.id, 50, ReservationStatus.pending)
+
+    assert await repository.get_confirmed_sum(sqlite_session, schedule.id) == 50
+    assert await repository.get_confirmed_sum(sqlite_session, schedule.id, exclude_id=confirmed.id) == 20
+    assert await repository.get_confirmed_sum(sqlite_session, schedule.id + 1) == 0
+
+# 테스트: 시험 일정별 확정 인원/잔여 정원 집계 (예약 없는 일정 포함)
+@pytest.mark.asyncio
+async def test_get_exam_schedules(sqlite_session, repository):
+    busy = await create_schedule(repository, sqlite_session, days=10, capacity=100)
+    empty = await create_schedule(repository, sqlite_session, days=20, capacity=40)
+    await create_reservation(repository, sqlite_session, busy.id, 70, ReservationStatus.confirmed)
+    await create_reservation(repository, sqlite_session, busy.id, 60, ReservationStatus.pending)
+
+    schedules = {s["exam_schedule_id"]: s for s in await repository.get_exam_schedules(sqlite_session)}
+
+    assert schedules[busy.id]["confirmed_count"] == 70
+    assert schedules[busy.id]["available_capacity"] == 30
+    assert schedules[empty.id]["confirmed_count"] == 0
+    assert schedules[empty.id]["available_capacity"] == 40
+
+# 테스트: 사용자별 예약 조회, id로 단건 조회
+@pytest.mark.asyncio
+async def test_list_by_user_and_get_by_id(sqlite_session, repository):
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    mine = await create_reservation(repository, sqlite_session, schedule.id, 1, user_id="user1")
+    await create_reservation(repository, sqlite_session, schedule.id, 1, user_id="user2")
+
+    reservations = await repository.list_by_user(sqlite_session, "user1")
+
+    assert [r.id for r in reservations] == [mine.id]
+    assert (await repository.get_by_id(sqlite_session, mine.id)).user_id == "user1"
+    assert await repository.get_by_id(sqlite_session, 999) is None
+
+# 테스트: 종료된 시험 일정은 Archive 테이블로 이동하고 Hot 쿼리에서 제외
+@pytest.mark.asyncio
+async def test_archive_completed_schedules(sqlite_session, repository):
+    past = await create_schedule(repository, sqlite_session, days=-10)
+    future = await create_schedule(repository, sqlite_session, days=10)
+    await create_reservation(repository, sqlite_session, past.id, 5, ReservationStatus.confirmed)
+    await create_reservation(repository, sqlite_session, future.id, 3, ReservationStatus.confirmed)
+
+    archived = await repository.archive_completed_schedules(sqlite_session, datetime.now(timezone.utc), batch_size=1)
+
+    assert archived == 1
+    assert [s["exam_schedule_id"] for s in await repository.get_exam_schedules(sqlite_session)] == [future.id]
+    rows = await repository.list_archived(sqlite_session)
+    assert [(r.exam_schedule_id, r.num_examinees) for r, _, _ in rows] == [(past.id, 5)]
+
+# 테스트: Archive 조회는 after_id 이후 limit 건씩 (필터 포함)
+@pytest.mark.asyncio
+async def test_list_archived_pagination(sqlite_session, repository):
+    past = await create_schedule(repository, sqlite_session, days=-10)
+    other = await create_schedule(repository, sqlite_session, days=-20)
+    for i in range(5):
+        await create_reservation(repository, sqlite_session, past.id, i + 1, user_id=f"user{i % 2}")
+    await create_reservation(repository, sqlite_session, other.id, 9)
+    await repository.archive_completed_schedules(sqlite_session, datetime.now(timezone.utc))
+
+    first = await repository.list_archived(sqlite_session, limit=2, exam_schedule_id=past.id)
+    second = await repository.list_archived(sqlite_session, after_id=first[-1][0].id, limit=2, exam_schedule_id=past.id)
+    assert [r.num_examinees for r, _, _ in first + second] == [1, 2, 3, 4]
+
+    rows = await repository.list_archived(sqlite_session, user_id="user1")
+    assert sorted(r.num_examinees for r, _, _ in rows) == [2, 4, 9]
+    rows = await repository.list_archived(sqlite_session, exam_schedule_id=past.id, user_id="user1")
+    assert [r.num_examinees for r, _, _ in rows] == [2, 4]
+
+# 테스트: 모든 시각 컬럼은 UTC로 저장되고 UTC tzinfo가 붙은 값으로 조회
+@pytest.mark.asyncio
+async def test_datetimes_are_stored_and_loaded_as_utc(sqlite_session, repository):
+    kst = timezone(timedelta(hours=9))
+    exam_start = datetime(2030, 4, 15, 23, 0, tzinfo=kst)
+    schedule = await repository.create_exam_schedule(sqlite_session, exam_start=exam_start, exam_end=exam_start + timedelta(hours=2), capacity=10)
+    reservation = await create_reservation(repository, sqlite_session, schedule.id, 1)
+    sqlite_session.expunge_all()
+
+    loaded = await repository.get_exam_schedule_by_id(sqlite_session, schedule.id)
+    assert loaded.exam_start == exam_start
+    assert loaded.exam_start.tzinfo is timezone.utc
+    assert loaded.exam_start.hour == 14
+
+    [row] = await repository.get_exam_schedules(sqlite_session)
+    assert row["exam_start"].tzinfo is timezone.utc
+    loaded_reservation = await repository.get_by_id(sqlite_session, reservation.id)
+    assert loaded_reservation.created_at.tzinfo is timezone.utc
@@ -0,0 +1,161 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.application.StatisticsService import StatisticsService
+from app.domain.Reservation import ReservationStatus, ReservationEventType
+from app.infrastructure.Database import Base, create_engine_for
+from app.infrastructure.ReservationRepository import ReservationORM, ReservationEventORM
+from app.infrastructure.StatisticsRepository import StatisticsRepository, ExamScheduleStatsORM, StatsWatermarkORM, WATERMARK_NAME
+from tests.ReservationRepositoryTest import create_schedule, create_reservation
+
+@pytest.fixture
+def statistics_service(statistics_repository):
+    return StatisticsService(repository=statistics_repository)
+
+def schedule_stats(result, exam_schedule_id):
+    return next(s for s in result["exam_schedules"] if s["exam_schedule_id"] == exam_schedule_id)
+
+# 테스트: 시험 일정별 상태 집계와 충원율, 일자별 이벤트 집계
+@pytest.mark.asyncio
+async def test_get_statistics(sqlite_session, repository, statistics_service):
+    schedule = await create_schedule(repository, sqlite_session, days=10, capacity=100)
+    empty = await create_schedule(repository, sqlite_session, days=20, capacity=50)
+    first = await create_reservation(repository, sqlite_session, schedule.id, 30)
+    await create_reservation(repository, sqlite_session, schedule.id, 5)
+    await repository.update_status(sqlite_session, first, ReservationStatus.confirmed)
+
+    result = await statistics_service.get_statistics(sqlite_session)
+
+    stats = schedule_stats(result, schedule.id)
+    assert (stats["pending_reservations"], stats["pending_examinees"]) == (1, 5)
+    assert (stats["confirmed_reservations"], stats["confirmed_examinees"]) == (1, 30)
+    assert stats["fill_rate"] == 0.3
+    assert schedule_stats(result, empty.id)["confirmed_examinees"] == 0
+
+    today = datetime.now(timezone.utc).date()
+    daily = {d["event_type"]: d for d in result["daily"] if d["day"] == today}
+    assert daily["created"]["reservations"] == 2
+    assert daily["created"]["examinees"] == 35
+    assert daily["confirmed"]["reservations"] == 1
+
+# 테스트: 이후 조회에서는 새로 쌓인 이벤트만 반영하고, 결과는 전체 재계산과 같음
+@pytest.mark.asyncio
+async def test_incremental_refresh_matches_rebuild(sqlite_session, repository, statistics_service):
+    schedule = await create_schedule(repository, sqlite_session, days=10, capacity=100)
+    first = await create_reservation(repository, sqlite_session, schedule.id, 10)
+    await statistics_service.get_statistics(sqlite_session)
+
+    second = await create_reservation(repository, sqlite_session, schedule.id, 7)
+    await repository.update_status(sqlite_session, first, ReservationStatus.confirmed)
+    await repository.update_num_examinees(sqlite_session, second, 8)
+    await repository.delete(sqlite_session, first)
+
+    result = await statistics_service.get_statistics(sqlite_session)
+    assert result["refreshed_events"] == 4
+    incremental = schedule_stats(result, schedule.id)
+    assert (incremental["pending_reservations"], incremental["pending_examinees"]) == (1, 8)
+    assert incremental["confirmed_examinees"] == 0
+
+    await statistics_service.rebuild_statistics(sqlite_session)
+    sqlite_session.expunge_all()
+    rebuilt = schedule_stats(await statistics_service.get_statistics(sqlite_session), schedule.id)
+    assert rebuilt == incremental
+    assert (await sqlite_session.get(ExamScheduleStatsORM, schedule.id)).pending_examinees == 8
+
+# 테스트: 조회 기간은 1일 이상
+@pytest.mark.asyncio
+async def test_get_statistics_invalid_days(sqlite_session, statistics_service):
+    with pytest.raises(Exception, match="Days must be greater than 0"):
+        await statistics_service.get_statistics(sqlite_session, days=0)
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+# 예약과 생성 이벤트를 지정한 id/생성 시각으로 커밋 (동시 트랜잭션의 커밋 순서를 흉내냅니다)
+async def commit_created_event(session, event_id: int, schedule_id: int, num_examinees: int, created_at: datetime):
+    session.add(ReservationORM(id=event_id, user_id="user1", exam_schedule_id=schedule_id,
+                               num_examinees=num_examinees, status=ReservationStatus.pending.value))
+    session.add(ReservationEventORM(id=event_id, reservation_id=event_id, exam_schedule_id=schedule_id,
+                                    event_type=ReservationEventType.created.value, status=ReservationStatus.pending.value,
+                                    num_examinees=num_examinees, created_at=created_at))
+    await session.commit()
+
+async def pending_reservations(session, exam_schedule_id: int) -> int:
+    stats = await session.get(ExamScheduleStatsORM, exam_schedule_id, populate_existing=True)
+    return stats.pending_reservations if stats else 0
+
+# 테스트: id 가 큰 이벤트가 먼저 커밋되어도, 앞선 id 의 이벤트가 늦게 커밋되면 함께 반영됨
+@pytest.mark.asyncio
+async def test_refresh_does_not_skip_events_committed_out_of_order(sqlite_session, repository):
+    now = datetime.now(timezone.utc)
+    clock = FakeClock(now)
+    statistics_repository = StatisticsRepository(refresh_lag=timedelta(seconds=5), clock=clock)
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    await statistics_repository.refresh(sqlite_session)
+
+    # 2번 이벤트가 먼저 커밋되고, 1번 이벤트의 트랜잭션은 아직 진행 중
+    await commit_created_event(sqlite_session, 2, schedule.id, 3, created_at=now)
+    clock.now = now + timedelta(seconds=1)
+    assert await statistics_repository.refresh(sqlite_session) == 0
+
+    await commit_created_event(sqlite_session, 1, schedule.id, 4, created_at=now - timedelta(milliseconds=500))
+    # 아직 이른 3번 이벤트는 다음 조회로 미룸
+    await commit_created_event(sqlite_session, 3, schedule.id, 5, created_at=now + timedelta(seconds=9))
+    clock.now = now + timedelta(seconds=10)
+    assert await statistics_repository.refresh(sqlite_session) == 2
+    assert (await sqlite_session.get(StatsWatermarkORM, WATERMARK_NAME)).last_event_id == 2
+    assert await pending_reservations(sqlite_session, schedule.id) == 2
+
+    clock.now = now + timedelta(seconds=20)
+    assert await statistics_repository.refresh(sqlite_session) == 1
+    assert await pending_reservations(sqlite_session, schedule.id) == 3
+
+# 테스트: 재계산은 아직 이른 이벤트의 변경분을 빼고 집계하여, 이후 증분 반영 시 두 번 세지 않음
+@pytest.mark.asyncio
+async def test_rebuild_leaves_unsettled_events_to_refresh(sqlite_session, repository):
+    now = datetime.now(timezone.utc)
+    clock = FakeClock(now + timedelta(seconds=1))
+    statistics_repository = StatisticsRepository(refresh_lag=timedelta(seconds=5), clock=clock)
+    schedule = await create_schedule(repository, sqlite_session, days=10)
+    await commit_created_event(sqlite_session, 1, schedule.id, 3, created_at=now)
+
+    assert await statistics_repository.rebuild(sqlite_session) == 0
+    assert await pending_reservations(sqlite_session, schedule.id) == 0
+
+    clock.now = now + timedelta(seconds=10)
+    assert await statistics_repository.refresh(sqlite_session) == 1
+    assert await pending_reservations(sqlite_session, schedule.id) == 1
+
+# 테스트: 빈 DB에서 첫 조회가 동시에 들어와도 watermark 행을 만든 요청만 재계산하고, 다른 요청은 충돌(409) 없이 증분 갱신
+@pytest.mark.asyncio
+async def test_concurrent_first_refresh_seeds_watermark_once(tmp_path, repository, statistics_repository):
+    engine = create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        schedule = await create_schedule(repository, session, days=10)
+        await create_reservation(repository, session, schedule.id, 7)
+
+    async with session_factory() as first, session_factory() as second:
+        # 첫 번째 요청이 watermark 행을 만든 뒤(커밋 전) 두 번째 요청이 시작됨
+        assert await statistics_repository._seed_watermark(first)
+        second_refresh = asyncio.create_task(statistics_repository.refresh(second))
+        await asyncio.sleep(0.1)
+        await statistics_repository.rebuild(first)
+        assert await second_refresh == 0
+
+        watermarks = (await first.execute(select(StatsWatermarkORM))).scalars().all()
+        result = await StatisticsService(statistics_repository).get_statistics(second)
+    await engine.dispose()
+
+    assert [w.last_event_id for w in watermarks] == [1]
+    assert schedule_stats(result, schedule.id)["pending_examinees"] == 7
@@ -0,0 +1,27 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.infrastructure.Database import Base, create_engine_for
+from app.infrastructure.ReservationRepository import ReservationRepository
+from app.infrastructure.StatisticsRepository import StatisticsRepository
+
+# 메모리 SQLite(aiosqlite) 위에서 실제 SQL을 실행하는 세션 (테스트마다 새 DB)
+@pytest.fixture
+async def sqlite_session():
+    engine = create_engine_for("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+@pytest.fixture
+def repository():
+    return ReservationRepository()
+
+# 테스트에서는 방금 기록한 이벤트도 바로 반영되도록 지연 시간을 0으로 둡니다.
+@pytest.fixture
+def statistics_repository():
+    return StatisticsRepository(refresh_lag=timedelta(0))